@@ -0,0 +1,534 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import sqlite3
+import argparse
+import resource
+import subprocess
+import multiprocessing as mp
+from email.message import EmailMessage
+
+# --- BENCH SETTINGS ---
+MAILBOX_SIZE = 100       # Messages per synthetic mailbox folder
+PDF_PAGES = 40           # Pages per synthetic PDF
+DOCX_PARAS = 400         # Paragraphs per synthetic DOCX
+DUP_EMAILS = 0.02        # Share of seeded emails fractured across two IDs (heal work)
+SAMPLE_CALLS = 20000     # Per-call samples for the micro stages
+STRESS_TARGETS = 5000    # Discovery entities seeded for the stress Hunters
+STARTUP_BUDGET_MS = 60   # Cumulative import time allowed for people_interface
+# Must never load just to show the Commander menu
+STARTUP_FORBIDDEN = ('pandas', 'numpy', 'PyPDF2', 'docx', 'openpyxl', 'email.parser', 'multiprocessing')
+TOLERANCE = 0.10         # Throughput drop that counts as a regression
+
+# Mirrors the tables people_init builds, so a corpus needs no Host setup
+BASE_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS entities (
+        sovereign_id TEXT PRIMARY KEY, display_name TEXT, entity_type TEXT, status TEXT);
+    CREATE TABLE IF NOT EXISTS affiliations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, source_id TEXT, target_id TEXT, relation TEXT);
+    CREATE TABLE IF NOT EXISTS metadata_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        action TEXT, module TEXT, details TEXT);
+    CREATE TABLE IF NOT EXISTS archetypes (id INTEGER PRIMARY KEY, name TEXT);
+    CREATE TABLE IF NOT EXISTS chart_of_accounts (id INTEGER PRIMARY KEY, domain TEXT, name TEXT);
+'''
+
+FIRST = ['Jane', 'John', 'Amara', 'Wei', 'Olga', 'Rahul', 'Lucia', 'Kofi', 'Hannah', 'Mateo']
+LAST = ['Doe', 'Smith', 'Okafor', 'Chen', 'Ivanova', 'Patel', 'Garcia', 'Mensah', 'Berg', 'Rossi']
+ORGS = ['Acme Capital LLC', 'Northwind Partners', 'Blue Harbor Ventures', 'Helix Systems Inc',
+        'Granite Trust', 'Orbit Advisors', 'Summit University', 'Lumen Foundation']
+NOISE = ['Unsubscribe from this list', 'View in browser', 'Page 3', '42%', 'http://example.com',
+         'Copyright 2030 All Rights Reserved', 'click here to read more', '------', 'thanks so much']
+
+def _person(rng):
+    return f"{rng.choice(FIRST)} {rng.choice(LAST)} {rng.randint(1, 999)}"
+
+def _email(rng):
+    return f"{rng.choice(FIRST).lower()}.{rng.randint(1, 99999)}@{rng.choice(['corp', 'mail', 'fund'])}.com"
+
+def _lines(rng, count):
+    """A plausible mix of Entities, emails and Noise."""
+    pick = [lambda: _person(rng), lambda: rng.choice(ORGS), lambda: rng.choice(NOISE), lambda: _email(rng)]
+    return [rng.choice(pick)() for _ in range(count)]
+
+def base_db(path):
+    """Creates an empty Substrate at `path` with the current schema."""
+    import people_core as core
+    core.release(path)
+    for stale in (path, path + '-wal', path + '-shm'):
+        if os.path.exists(stale): os.remove(stale)
+    conn = sqlite3.connect(path)
+    conn.executescript(BASE_SCHEMA)
+    conn.close()
+    core.connect(path)
+
+# --- CORPUS GENERATORS ---
+def write_maildir(root, count, rng):
+    for i in range(count):
+        box = os.path.join(root, f"box{i // MAILBOX_SIZE:04d}", 'cur')
+        os.makedirs(box, exist_ok=True)
+        msg = EmailMessage()
+        msg['From'] = f"{_person(rng)} <{_email(rng)}>"
+        msg['Subject'] = f"Re: {rng.choice(ORGS)} intro {i}"
+        msg.set_content('\n'.join(_lines(rng, rng.randint(5, 30))))
+        if rng.random() < 0.2:
+            msg.add_attachment(rng.randbytes(2048), maintype='application',
+                               subtype='octet-stream', filename='deck.bin')
+        with open(os.path.join(box, f"{i}.eml"), 'wb') as f: f.write(bytes(msg))
+
+def _pdf_escape(text):
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def write_pdf(path, pages):
+    """Minimal hand-rolled PDF: one Helvetica text stream per page."""
+    objs = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+            "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for lines in pages:
+        body = "BT /F1 10 Tf 12 TL 50 780 Td " + ' '.join(f"({_pdf_escape(l)}) Tj T*" for l in lines) + " ET"
+        objs.append(f"<< /Length {len(body.encode('latin-1'))} >>\nstream\n{body}\nendstream")
+        objs.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                    f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objs)} 0 R >>")
+        kids.append(f"{len(objs)} 0 R")
+    objs[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+    out, offsets = bytearray(b"%PDF-1.4\n"), []
+    for n, obj in enumerate(objs, 1):
+        offsets.append(len(out))
+        out += f"{n} 0 obj\n{obj}\nendobj\n".encode('latin-1')
+    xref = len(out)
+    out += f"xref\n0 {len(objs) + 1}\n0000000000 65535 f \n".encode()
+    out += ''.join(f"{o:010d} 00000 n \n" for o in offsets).encode()
+    out += f"trailer\n<< /Size {len(objs) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    with open(path, 'wb') as f: f.write(out)
+
+def write_docx(path, rng):
+    from docx import Document
+    doc = Document()
+    for line in _lines(rng, DOCX_PARAS): doc.add_paragraph(line)
+    doc.save(path)
+
+def write_linkedin(path, count, rng):
+    import csv
+    with open(path, 'w', newline='') as f:
+        f.write("Notes:\n\"Exported connections\"\n\n")
+        out = csv.writer(f)
+        out.writerow(['First Name', 'Last Name', 'URL', 'Email Address', 'Company', 'Position', 'Connected On'])
+        for _ in range(count):
+            out.writerow([rng.choice(FIRST), f"{rng.choice(LAST)}{rng.randint(1, 999)}", '',
+                          _email(rng) if rng.random() < 0.3 else '', rng.choice(ORGS + ['']),
+                          'Partner', '01 Jan 2030'])
+
+def write_seed_db(path, log_rows, rng):
+    """Pre-populated Substrate with `log_rows` metadata_logs rows."""
+    import uuid
+    import people_core as core
+    base_db(path)
+    with core.SignalWriter(path, batch_size=50000) as w:
+        for _ in range(log_rows):
+            if rng.random() < 0.3: w.write(_email(rng), 'email', f"Header: {rng.choice(ORGS)}", 'people_bench')
+            else: w.write(rng.choice([_person(rng), rng.choice(ORGS)]), 'entity_name',
+                          f"Doc: report{rng.randint(1, 500)}.pdf", 'people_bench')
+    # Fracture a slice of emails across a second ID so the heal has real work
+    conn = core.connect(path)
+    rows = conn.execute("SELECT signal_value, details, context_id FROM metadata_logs WHERE signal_type = 'email' "
+                        "ORDER BY id")
+    fractured = []
+    for value, details, context_id in rows:
+        if rng.random() >= DUP_EMAILS: continue
+        dup_id = uuid.UUID(int=rng.getrandbits(128)).hex[:8]
+        fractured.append(('SIGNAL_MINED', 'people_bench', dup_id + details[8:], dup_id, 'email', value, context_id))
+    conn.executemany("INSERT INTO metadata_logs (action, module, details, sovereign_id, signal_type, signal_value, "
+                     "context_id) VALUES (?, ?, ?, ?, ?, ?, ?)", fractured)
+    conn.executemany("INSERT OR IGNORE INTO entities VALUES (?, ?, 'Individual', 'Discovery')",
+                     [(f[3], f[5].split('@')[0]) for f in fractured])
+    core.rebuild_entity_stats(conn)  # The raw inserts bypassed the Scoreboard
+    conn.commit()
+    core.release(path)  # Checkpoint so the corpus is a single self-contained file
+
+def generate(out_dir, size=1000, seed=7, log_rows=1000000):
+    """Builds a reproducible corpus: the same (size, seed) gives the same files."""
+    rng = random.Random(seed)
+    if os.path.exists(out_dir): shutil.rmtree(out_dir)
+    os.makedirs(os.path.join(out_dir, 'docs'))
+    print(f"  [Bench] Generating corpus in {out_dir} (size={size}, seed={seed})...")
+    write_maildir(os.path.join(out_dir, 'maildir'), size, rng)
+    for i in range(max(1, size // 250)):
+        write_pdf(os.path.join(out_dir, 'docs', f"board_pack_{i}.pdf"),
+                  [_lines(rng, 45) for _ in range(PDF_PAGES)])
+        write_docx(os.path.join(out_dir, 'docs', f"memo_{i}.docx"), rng)
+    write_linkedin(os.path.join(out_dir, 'Connections.csv'), size * 10, rng)
+    write_seed_db(os.path.join(out_dir, 'people.db'), log_rows, rng)
+    with open(os.path.join(out_dir, 'corpus.json'), 'w') as f:
+        json.dump({'size': size, 'seed': seed, 'log_rows': log_rows}, f)
+    print("  [+] Corpus ready.")
+
+# --- STAGES ---
+# Each stage runs in its own spawned process against `db` and returns
+# (items, [per-call seconds]).
+def _log_count(db):
+    """Logged signal occurrences (rows are compacted, so not COUNT(*))."""
+    conn = sqlite3.connect(db)
+    try: return conn.execute("SELECT SUM(COALESCE(occurrences, 1)) FROM metadata_logs").fetchone()[0] or 0
+    finally: conn.close()
+
+def _router_stage(db, targets):
+    import people_ingest
+    base_db(db)
+    latencies = []
+    for target in targets:
+        start = time.perf_counter()
+        people_ingest.router(target, force=True)
+        latencies.append(time.perf_counter() - start)
+    return _log_count(db), latencies
+
+def stage_router_maildir(corpus, db):
+    root = os.path.join(corpus, 'maildir')
+    return _router_stage(db, sorted(e.path for e in os.scandir(root) if e.is_dir()))
+
+def stage_router_pdf(corpus, db):
+    docs = os.path.join(corpus, 'docs')
+    return _router_stage(db, sorted(os.path.join(docs, f) for f in os.listdir(docs) if f.endswith('.pdf')))
+
+def stage_router_docx(corpus, db):
+    docs = os.path.join(corpus, 'docs')
+    return _router_stage(db, sorted(os.path.join(docs, f) for f in os.listdir(docs) if f.endswith('.docx')))
+
+def stage_router_linkedin(corpus, db):
+    return _router_stage(db, [os.path.join(corpus, 'Connections.csv')])
+
+def stage_calculate_gravity(corpus, db):
+    import people_core as core
+    rng = random.Random(11)
+    lines = _lines(rng, SAMPLE_CALLS)
+    core.gravity_verdict.cache_clear()
+    latencies = []
+    for line in lines:
+        start = time.perf_counter()
+        core.calculate_gravity(line)
+        latencies.append(time.perf_counter() - start)
+    return len(lines), latencies
+
+def stage_ingest_signal(corpus, db):
+    import people_core as core
+    base_db(db)
+    rng = random.Random(13)
+    latencies = []
+    for _ in range(SAMPLE_CALLS // 10):
+        start = time.perf_counter()
+        core.ingest_signal(_person(rng), 'entity_name', 'Bench', 'people_bench')
+        latencies.append(time.perf_counter() - start)
+    return len(latencies), latencies
+
+def stage_self_heal_network(corpus, db):
+    import people_core as core
+    shutil.copyfile(os.path.join(corpus, 'people.db'), db)
+    start = time.perf_counter()
+    core.self_heal_network(full=True)
+    return _log_count(db), [time.perf_counter() - start]
+
+def stage_get_context(corpus, db):
+    import people_core as core
+    import people_survey
+    shutil.copyfile(os.path.join(corpus, 'people.db'), db)
+    conn = core.connect(db)
+    cursor = conn.cursor()
+    ids = [r[0] for r in cursor.execute(
+        "SELECT sovereign_id FROM entities ORDER BY sovereign_id LIMIT ?", (SAMPLE_CALLS // 10,))]
+    latencies = []
+    for sov_id in ids:
+        start = time.perf_counter()
+        people_survey.get_context(cursor, sov_id)
+        latencies.append(time.perf_counter() - start)
+    return len(ids), latencies
+
+STAGES = {
+    'router_maildir': stage_router_maildir,
+    'router_pdf': stage_router_pdf,
+    'router_docx': stage_router_docx,
+    'router_linkedin': stage_router_linkedin,
+    'calculate_gravity': stage_calculate_gravity,
+    'ingest_signal': stage_ingest_signal,
+    'self_heal_network': stage_self_heal_network,
+    'get_context': stage_get_context,
+}
+
+def _percentile(values, pct):
+    values = sorted(values)
+    if not values: return 0.0
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+def _stage_child(name, corpus, db, queue):
+    import io
+    import contextlib
+    import people_core as core
+    core.DB_NAME = db
+    with contextlib.redirect_stdout(io.StringIO()):  # Keep the miners' chatter out of the report
+        start = time.perf_counter()
+        items, latencies = STAGES[name](corpus, db)
+        elapsed = time.perf_counter() - start
+    # Parser pool workers are reaped by now: RUSAGE_CHILDREN is the largest one's peak
+    rss, workers_rss = (resource.getrusage(who).ru_maxrss
+                        for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN))
+    if sys.platform == 'darwin': rss, workers_rss = rss // 1024, workers_rss // 1024  # macOS reports bytes
+    queue.put({
+        'items': items,
+        'seconds': round(elapsed, 4),
+        'per_sec': round(items / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(_percentile(latencies, 50) * 1000, 4),
+        'p99_ms': round(_percentile(latencies, 99) * 1000, 4),
+        'peak_rss_kb': rss,
+        'peak_worker_rss_kb': workers_rss,
+    })
+
+def run(corpus, stages=None, workdir=None):
+    """Times each stage in a fresh process. Returns the JSON-ready report."""
+    ctx = mp.get_context('spawn')
+    workdir = workdir or os.path.join(corpus, 'work')
+    os.makedirs(workdir, exist_ok=True)
+    with open(os.path.join(corpus, 'corpus.json')) as f: meta = json.load(f)
+    report = {'corpus': meta, 'python': sys.version.split()[0], 'stages': {}}
+    for name in stages or STAGES:
+        print(f"  [Bench] {name}...", flush=True)
+        queue = ctx.Queue()
+        child = ctx.Process(target=_stage_child,
+                            args=(name, corpus, os.path.join(workdir, f"{name}.db"), queue))
+        child.start()
+        result = queue.get()
+        child.join()
+        report['stages'][name] = result
+        print(f"    {result['per_sec']:>12,.1f}/s  p50 {result['p50_ms']:.3f}ms  "
+              f"p99 {result['p99_ms']:.3f}ms  rss {result['peak_rss_kb'] // 1024}MB"
+              + (f" (workers {result['peak_worker_rss_kb'] // 1024}MB)" if result['peak_worker_rss_kb'] else ''))
+    return report
+
+def compare(report, baseline, tolerance=TOLERANCE):
+    """Prints throughput deltas vs `baseline`. Returns the regressed stage names."""
+    regressions = []
+    print("\n  --- BASELINE COMPARISON ---")
+    for name, now in report['stages'].items():
+        then = baseline.get('stages', {}).get(name)
+        if not then or not then['per_sec']:
+            print(f"  [~] {name:<20} (no baseline)")
+            continue
+        ratio = now['per_sec'] / then['per_sec']
+        flag = '!' if ratio < 1 - tolerance else '+'
+        if flag == '!': regressions.append(name)
+        print(f"  [{flag}] {name:<20} {ratio:6.2f}x  ({then['per_sec']:,.1f}/s -> {now['per_sec']:,.1f}/s)")
+    return regressions
+
+# --- STRESS ---
+# One ingest writer and N Hunter Nodes hammering the same people.db at once.
+def _stress_ingest(db, signals, queue):
+    import people_core as core
+    core.DB_NAME = db
+    failures, start = 0, time.perf_counter()
+    with core.SignalWriter(batch_size=500) as w:
+        for i in range(signals):
+            try: w.write(f"Stress Entity {i}", 'entity_name', 'Stress Ingest', 'people_bench')
+            except sqlite3.OperationalError: failures += 1
+    queue.put({'role': 'ingest', 'ops': signals, 'seconds': time.perf_counter() - start,
+               'failures': failures, 'lock_retries': core.METRICS.counters['sqlite.lock_retries']})
+
+def _stress_hunter(db, verdicts, node, queue):
+    import people_core as core
+    import people_survey
+    core.DB_NAME = db
+    failures, done, after, start = 0, 0, None, time.perf_counter()
+    while done < verdicts:
+        try:
+            page = people_survey.get_page(after)
+            if not page:
+                after = None
+                continue
+            # Nodes share the priority queue; each takes a different row of the page
+            sov_id, name, _, sources, signals = page[node % len(page)]
+            after = (sources, signals, sov_id)
+            def mature(cur):
+                cur.execute("UPDATE entities SET status = 'Verified' WHERE sovereign_id = ?", (sov_id,))
+                core.log_action('NODE_MATURE', f"{sov_id} :: Stress Node {node}")
+            core.write_transaction(mature)
+        except sqlite3.OperationalError: failures += 1
+        done += 1
+    queue.put({'role': f"hunter{node}", 'ops': verdicts, 'seconds': time.perf_counter() - start,
+               'failures': failures, 'lock_retries': core.METRICS.counters['sqlite.lock_retries']})
+
+def stress(db, hunters=4, signals=200000, verdicts=500):
+    """
+    Runs one ingest writer and `hunters` Hunter processes concurrently.
+    Returns: the per-process results; any 'failures' means a lock escaped the retry policy.
+    """
+    import people_core as core
+    base_db(db)
+    with core.SignalWriter(db) as w:
+        for i in range(STRESS_TARGETS): w.write(f"Stress Target {i}", 'entity_name', 'Stress Seed', 'people_bench')
+    core.release(db)
+    ctx = mp.get_context('spawn')
+    queue = ctx.Queue()
+    procs = [ctx.Process(target=_stress_ingest, args=(db, signals, queue))]
+    procs += [ctx.Process(target=_stress_hunter, args=(db, verdicts, n, queue)) for n in range(hunters)]
+    for p in procs: p.start()
+    results = [queue.get() for _ in procs]
+    for p in procs: p.join()
+    for r in sorted(results, key=lambda r: r['role']):
+        print(f"  [{'!' if r['failures'] else '+'}] {r['role']:<8} {r['ops'] / r['seconds']:>10,.1f} ops/s  "
+              f"failures {r['failures']}  lock retries {r['lock_retries']}")
+    return results
+
+# --- STARTUP ---
+def startup(module='people_interface', budget_ms=STARTUP_BUDGET_MS, runs=5):
+    """
+    Measures `module`'s import cost with -X importtime (best of `runs`).
+    Returns: (cumulative_ms, heaviest [(ms, name)], forbidden modules loaded)
+    """
+    best = None
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                              capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        rows = []
+        for line in proc.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line: continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            rows.append((int(cumulative) / 1000, name.rstrip()))
+        # Children print before their parent: the subtree is the run of
+        # indented rows directly above `module`'s own top-level row
+        end = next(i for i, (ms, name) in enumerate(rows) if name.strip() == module)
+        start = end
+        while start > 0 and rows[start - 1][1].startswith('  '): start -= 1
+        total = rows[end][0]
+        if best is None or total < best[0]: best = (total, rows[start:end])
+    total, rows = best
+    loaded = {name.strip() for _, name in rows}
+    forbidden = sorted(m for m in loaded if m.split('.')[0] in STARTUP_FORBIDDEN or m in STARTUP_FORBIDDEN)
+    # Direct imports of `module` sit one indent level (two spaces) below it
+    heaviest = sorted(((ms, name.strip()) for ms, name in rows
+                       if len(name) - len(name.lstrip()) == 3), reverse=True)[:10]
+    print(f"  [{'+' if total <= budget_ms and not forbidden else '!'}] import {module}: "
+          f"{total:.1f}ms (budget {budget_ms}ms)")
+    for ms, name in heaviest: print(f"      {ms:8.1f}ms  {name}")
+    if forbidden: print(f"  [!] Heavy modules loaded at startup: {', '.join(forbidden)}")
+    return total, heaviest, forbidden
+
+# --- PARITY ---
+# The per-pattern Gravity & Classification the compiled engine replaced. Kept
+# verbatim as the reference the engine (and its pandas path) must agree with.
+def _reference_gravity(text):
+    import re
+    import people_core as core
+    text = text.strip()
+    if len(text) < 3 or len(text) > 80: return False
+    for pattern in core.NOISE_PATTERNS:
+        if re.search(pattern, text, re.IGNORECASE): return False
+    if not re.search(r'[a-zA-Z]', text): return False
+    if text.islower(): return False
+    return True
+
+def _reference_classify(text):
+    import people_core as core
+    for suffix in core.ORG_SUFFIXES:
+        if suffix.lower() in text.lower():
+            return 'Organization'
+    return 'Individual'
+
+def _fuzz_lines(rng, count):
+    """Corpus lines plus mutants: noise & suffix fragments, odd case, padding, digits, lengths near the bounds."""
+    import people_core as core
+    fragments = [p.strip('^$\\d+%') for p in core.NOISE_PATTERNS] + [s.strip() for s in core.ORG_SUFFIXES]
+    alphabet = 'abcXYZ019 -%@./|_\t'
+    lines = []
+    for line in _lines(rng, count):
+        roll = rng.random()
+        if roll < 0.2: line = line.upper() if rng.random() < 0.5 else line.lower()
+        elif roll < 0.4: line = f"{line} {rng.choice(fragments)}" if rng.random() < 0.5 else f"{rng.choice(fragments)}{line}"
+        elif roll < 0.55: line = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))
+        elif roll < 0.65: line = (line + ' ') * rng.randint(1, 12)
+        elif roll < 0.75: line = f"{' ' * rng.randint(0, 3)}{line}{' ' * rng.randint(0, 3)}"
+        elif roll < 0.8: line = rng.choice(['Page ', '', 'http']) + str(rng.randint(0, 999)) + rng.choice(['', '%', 'x'])
+        lines.append(line)
+    return lines
+
+def parity(lines=60000, seed=2):
+    """
+    Checks calculate_gravity, classify_entity and both batch paths against the
+    per-pattern reference on a seeded fuzz corpus. BATCH_VECTOR_MIN is lowered
+    so the pandas path runs too (when pandas is installed).
+    Returns: mismatches as [(check, line, expected, got)]
+    """
+    import people_core as core
+    corpus = _fuzz_lines(random.Random(seed), lines)
+    gravity = [_reference_gravity(line) for line in corpus]
+    labels = [_reference_classify(line) for line in corpus]
+    core.gravity_verdict.cache_clear()
+    core.classify_entity.cache_clear()
+
+    results = {'calculate_gravity': (gravity, [core.calculate_gravity(line) for line in corpus]),
+               'classify_entity': (labels, [core.classify_entity(line) for line in corpus])}
+    floor = core.BATCH_VECTOR_MIN
+    try:
+        for name, threshold in (('batch', len(corpus) + 1), ('batch_vector', 1)):
+            core.BATCH_VECTOR_MIN = threshold
+            results[f"calculate_gravity_{name}"] = (gravity, core.calculate_gravity_batch(corpus))
+            results[f"classify_{name}"] = (labels, core.classify_batch(corpus))
+    finally:
+        core.BATCH_VECTOR_MIN = floor
+
+    mismatches = []
+    for check, (expected, got) in results.items():
+        wrong = [(check, line, e, g) for line, e, g in zip(corpus, expected, got) if e != g]
+        mismatches += wrong
+        print(f"  [{'!' if wrong else '+'}] {check:<30} {len(wrong)} / {len(corpus)} mismatched")
+    if core._load_pandas() is None: print("  [~] pandas not installed: *_batch_vector ran the scalar path")
+    for check, line, expected, got in mismatches[:10]:
+        print(f"      {check}: {line!r} expected {expected!r}, got {got!r}")
+    return mismatches
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sovereign ingest/heal benchmark suite.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    gen = sub.add_parser('generate', help="Build a synthetic corpus.")
+    gen.add_argument('corpus')
+    gen.add_argument('--size', type=int, default=1000, help="Messages (and 10x LinkedIn rows).")
+    gen.add_argument('--seed', type=int, default=7)
+    gen.add_argument('--log-rows', type=int, default=1000000, help="metadata_logs rows in people.db.")
+    bench = sub.add_parser('run', help="Time every stage against a corpus.")
+    bench.add_argument('corpus')
+    bench.add_argument('--stage', action='append', choices=list(STAGES), help="Run only these stages.")
+    bench.add_argument('--json', help="Write the report here.")
+    bench.add_argument('--baseline', help="Compare against a saved report.")
+    bench.add_argument('--tolerance', type=float, default=TOLERANCE)
+    hammer = sub.add_parser('stress', help="Concurrent ingest writer + Hunter Nodes on one db.")
+    hammer.add_argument('db')
+    hammer.add_argument('--hunters', type=int, default=4)
+    hammer.add_argument('--signals', type=int, default=200000)
+    hammer.add_argument('--verdicts', type=int, default=500, help="Targets each Hunter matures.")
+    boot = sub.add_parser('startup', help="Check the Commander's import-time budget.")
+    boot.add_argument('--module', default='people_interface')
+    boot.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS)
+    check = sub.add_parser('parity', help="Compiled Gravity/Classification vs the per-pattern reference.")
+    check.add_argument('--lines', type=int, default=60000)
+    check.add_argument('--seed', type=int, default=2)
+    args = parser.parse_args(argv)
+
+    if args.command == 'startup':
+        total, _, forbidden = startup(args.module, args.budget_ms)
+        return 1 if total > args.budget_ms or forbidden else 0
+    if args.command == 'parity':
+        return 1 if parity(args.lines, args.seed) else 0
+    if args.command == 'generate':
+        generate(args.corpus, args.size, args.seed, args.log_rows)
+        return 0
+    if args.command == 'stress':
+        results = stress(args.db, args.hunters, args.signals, args.verdicts)
+        return 1 if any(r['failures'] for r in results) else 0
+    report = run(args.corpus, args.stage)
+    if args.json:
+        with open(args.json, 'w') as f: json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f: baseline = json.load(f)
+        if compare(report, baseline, args.tolerance): return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
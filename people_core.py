@@ -1,13 +1,21 @@
 import sqlite3
 import re
 import uuid
+import zlib
 import os
+import json
+import time
+import threading
 import warnings
+from collections import ChainMap, Counter
+from contextlib import contextmanager
+from functools import lru_cache
 
 # Silence technical noise
 warnings.filterwarnings('ignore')
 
 DB_NAME = "people.db"
+REPORT_DIR = "ingest_reports"  # JSON run reports & cProfile dumps
 
 # --- UNIVERSAL GRAVITY SETTINGS ---
 # The Single Source of Truth for "Noise"
@@ -29,36 +37,371 @@ ORG_SUFFIXES = [
 
 EMAIL_REGEX = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
 
+# --- TELEMETRY ---
+class Telemetry:
+    """
+    The Flight Recorder. Cheap per-stage timers and counters for one run.
+    Pool workers drain() theirs and ship them back with their results.
+    """
+    def __init__(self):
+        self.timers = Counter()    # stage -> seconds
+        self.counters = Counter()  # event -> count
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try: yield
+        finally: self.timers[name] += time.perf_counter() - start
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def snapshot(self):
+        return {'timers': dict(self.timers), 'counters': dict(self.counters)}
+
+    def drain(self):
+        snap = self.snapshot()
+        self.reset()
+        return snap
+
+    def merge(self, snap):
+        self.timers.update(snap['timers'])
+        self.counters.update(snap['counters'])
+
+    def reset(self):
+        self.timers.clear()
+        self.counters.clear()
+
+METRICS = Telemetry()
+
+# --- COMPILED GRAVITY ENGINE ---
+# One pass per line instead of one re.search per pattern. Each pattern is a
+# named group so a rejection can be charged to the pattern that caused it.
+NOISE_REGEX = re.compile('|'.join(f'(?P<n{i}>{p})' for i, p in enumerate(NOISE_PATTERNS)), re.IGNORECASE)
+ALPHA_REGEX = re.compile(r'[a-zA-Z]')
+SUFFIX_REGEX = re.compile('|'.join(re.escape(s.lower()) for s in ORG_SUFFIXES))
+VERDICT_CACHE_SIZE = 65536  # Footers & signatures repeat across thousands of messages
+BATCH_VECTOR_MIN = 10000    # Hand batches this large to pandas (if installed)
+
+@lru_cache(maxsize=VERDICT_CACHE_SIZE)
+def gravity_verdict(text):
+    """
+    Why a string passes or fails Gravity.
+    Returns: 'accepted', 'length', 'noise:<pattern>', 'no_alpha' or 'lowercase'
+    """
+    text = text.strip()
+    if len(text) < 3 or len(text) > 80: return 'length'
+    noise = NOISE_REGEX.search(text)
+    if noise: return f"noise:{NOISE_PATTERNS[int(noise.lastgroup[1:])]}"
+    if not ALPHA_REGEX.search(text): return 'no_alpha'
+    if text.islower(): return 'lowercase' # Reject lazy text
+    return 'accepted'
+
 def calculate_gravity(text):
     """
     Universal Math: Is this string a valid Entity?
     Returns: Boolean
     """
-    text = text.strip()
-    if len(text) < 3 or len(text) > 80: return False
-    for pattern in NOISE_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE): return False
-    if not re.search(r'[a-zA-Z]', text): return False
-    if text.islower(): return False # Reject lazy text
-    return True
+    verdict = gravity_verdict(text)
+    METRICS.counters[f"gravity.{verdict}"] += 1
+    return verdict == 'accepted'
 
+@lru_cache(maxsize=VERDICT_CACHE_SIZE)
 def classify_entity(text):
     """
     Decides if a Name is an Organization or Individual based on Suffixes.
     """
-    for suffix in ORG_SUFFIXES:
-        if suffix.lower() in text.lower():
-            return 'Organization'
+    if SUFFIX_REGEX.search(text.lower()):
+        return 'Organization'
     return 'Individual'
 
-def ingest_signal(value, signal_type, context, source_module):
+def _load_pandas():
+    try:
+        import pandas as pd
+        return pd
+    except ImportError:
+        return None
+
+def calculate_gravity_batch(lines):
+    """
+    Batch Gravity. Same verdicts as calculate_gravity, one per line.
+    Large batches run as pandas vectorized string ops.
+    """
+    lines = list(lines)
+    pd = _load_pandas() if len(lines) >= BATCH_VECTOR_MIN else None
+    if pd is None:
+        return [calculate_gravity(line) for line in lines]
+    text = pd.Series(lines, dtype=object).str.strip()
+    length = text.str.len()
+    noise = text.str.extract(NOISE_REGEX)  # One column per pattern; the match fills its own
+    # Lowest precedence first, so earlier checks overwrite later ones
+    verdict = pd.Series('accepted', index=text.index, dtype=object)
+    verdict[text.str.islower().astype(bool)] = 'lowercase'
+    verdict[~text.str.contains(ALPHA_REGEX, regex=True)] = 'no_alpha'
+    hit = noise.notna()
+    if hit.any().any():
+        rows = hit.any(axis=1)
+        verdict[rows] = 'noise:' + hit[rows].idxmax(axis=1).map(lambda g: NOISE_PATTERNS[int(g[1:])])
+    verdict[(length < 3) | (length > 80)] = 'length'
+    METRICS.counters.update({f"gravity.{k}": int(v) for k, v in verdict.value_counts().items()})
+    return (verdict == 'accepted').tolist()
+
+def classify_batch(names):
+    """
+    Batch Classification. Same labels as classify_entity, one per name.
+    """
+    names = list(names)
+    pd = _load_pandas() if len(names) >= BATCH_VECTOR_MIN else None
+    if pd is None:
+        return [classify_entity(name) for name in names]
+    is_org = pd.Series(names, dtype=object).str.lower().str.contains(SUFFIX_REGEX, regex=True)
+    return is_org.map({True: 'Organization', False: 'Individual'}).tolist()
+
+# --- SUBSTRATE SCHEMA ---
+# Structured signal columns carried alongside the free-text `details`.
+SIGNAL_COLUMNS = ('sovereign_id', 'signal_type', 'signal_value')
+# Compacted provenance: one SIGNAL_MINED row per (sovereign_id, type, value,
+# context) with an occurrence count. `timestamp` is the first occurrence and
+# the context string lives once in log_contexts.
+COMPACT_COLUMNS = (('occurrences', 'INTEGER DEFAULT 1'), ('last_seen', 'TEXT'), ('context_id', 'INTEGER'))
+
+def ensure_schema(conn):
+    """
+    The Migrator. Brings an existing people.db up to the current layout.
+    Idempotent; a no-op on a database that has not been initialized yet.
+    """
+    cols = {row[1] for row in conn.execute("PRAGMA table_info(metadata_logs)")}
+    if not cols: return
+    missing = [col for col in SIGNAL_COLUMNS if col not in cols]
+    for col in missing:
+        conn.execute(f"ALTER TABLE metadata_logs ADD COLUMN {col} TEXT")
+    if missing:
+        # Backfill from the legacy "sov_id :: Type: x | Value: y | Context: z" format
+        conn.execute('''
+            UPDATE metadata_logs SET sovereign_id = substr(details, 1, instr(details, ' :: ') - 1)
+            WHERE sovereign_id IS NULL AND instr(details, ' :: ') > 1
+        ''')
+        conn.execute('''
+            UPDATE metadata_logs SET
+                signal_type = substr(details, instr(details, 'Type: ') + 6,
+                                     instr(details, ' | Value: ') - instr(details, 'Type: ') - 6),
+                signal_value = substr(details, instr(details, ' | Value: ') + 10,
+                                      instr(details, ' | Context: ') - instr(details, ' | Value: ') - 10)
+            WHERE action = 'SIGNAL_MINED' AND signal_type IS NULL
+              AND instr(details, 'Type: ') > 0
+              AND instr(details, ' | Value: ') > instr(details, 'Type: ')
+              AND instr(details, ' | Context: ') > instr(details, ' | Value: ')
+        ''')
+    for col, decl in COMPACT_COLUMNS:
+        if col not in cols: conn.execute(f"ALTER TABLE metadata_logs ADD COLUMN {col} {decl}")
+    conn.execute("CREATE TABLE IF NOT EXISTS log_contexts (id INTEGER PRIMARY KEY, context TEXT UNIQUE)")
+    # Legacy rows (context still inside `details`) stay out until compact_logs() folds them
+    conn.execute('''
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_logs_occurrence
+        ON metadata_logs (sovereign_id, signal_type, signal_value, context_id)
+        WHERE action = 'SIGNAL_MINED' AND context_id IS NOT NULL
+    ''')
+    # Every SIGNAL_MINED row in the legacy evidence format, compacted or not
+    conn.execute('''
+        CREATE VIEW IF NOT EXISTS signal_evidence AS
+        SELECT l.id, l.sovereign_id, l.signal_type, l.signal_value,
+               COALESCE(l.occurrences, 1) AS occurrences, l.timestamp AS first_seen,
+               COALESCE(l.last_seen, l.timestamp) AS last_seen,
+               COALESCE(c.context, CASE WHEN instr(l.details, ' | Context: ') > 0
+                                        THEN substr(l.details, instr(l.details, ' | Context: ') + 12) END) AS context,
+               substr(l.details, instr(l.details, ' :: ') + 4) || COALESCE(' | Context: ' || c.context, '') AS evidence
+        FROM metadata_logs l LEFT JOIN log_contexts c ON c.id = l.context_id
+        WHERE l.action = 'SIGNAL_MINED'
+    ''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_sovereign ON metadata_logs (sovereign_id, id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_signal ON metadata_logs (signal_type, signal_value)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_entities_status ON entities (status, sovereign_id)")
+    conn.execute("CREATE TABLE IF NOT EXISTS core_state (key TEXT PRIMARY KEY, value TEXT)")
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS ingest_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, started_at TEXT, target TEXT,
+            seconds REAL, signals INTEGER, signals_per_sec REAL, report TEXT)
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS ingest_manifest (
+            path TEXT PRIMARY KEY, size INTEGER, mtime REAL,
+            content_hash TEXT, ingested_at TEXT DEFAULT CURRENT_TIMESTAMP)
+    ''')
+    # Fuzzy resolution blocking indexes (see people_resolve)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS entity_keys (
+            sovereign_id TEXT PRIMARY KEY, entity_type TEXT, norm_key TEXT)
+    ''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_keys_block ON entity_keys (entity_type, norm_key)")
+    conn.execute("CREATE TABLE IF NOT EXISTS entity_lsh (band INTEGER, bucket INTEGER, sovereign_id TEXT)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_lsh_bucket ON entity_lsh (band, bucket)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_lsh_sovereign ON entity_lsh (sovereign_id)")
+    _ensure_stats(conn)
+    conn.commit()
+
+def source_key(context):
+    """Stable 32-bit key for a signal's source (its context line)."""
+    return zlib.crc32((context or '').encode())
+
+def _ensure_stats(conn):
+    """
+    The Scoreboard. entity_stats holds per-Entity evidence totals, kept
+    current by SignalWriter & merge_identities so the Hunter never aggregates
+    metadata_logs. entity_sources backs the distinct source count.
+    """
+    exists = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entity_stats'").fetchone()
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS entity_stats (
+            sovereign_id TEXT PRIMARY KEY, signal_count INTEGER DEFAULT 0, source_count INTEGER DEFAULT 0,
+            first_seen TEXT, last_seen TEXT, last_log_id INTEGER, last_context TEXT)
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS entity_sources (
+            sovereign_id TEXT, source_key INTEGER, PRIMARY KEY (sovereign_id, source_key)) WITHOUT ROWID
+    ''')
+    # A new source bumps its Entity's count; duplicates are ignored before they get here
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_sources_count AFTER INSERT ON entity_sources BEGIN
+            UPDATE entity_stats SET source_count = source_count + 1 WHERE sovereign_id = NEW.sovereign_id;
+        END
+    ''')
+    # The Hunter's queue order: most independent sources, then most signals
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_stats_priority
+        ON entity_stats (source_count DESC, signal_count DESC, sovereign_id DESC)
+    ''')
+    if not exists: rebuild_entity_stats(conn)
+
+def rebuild_entity_stats(conn):
+    """
+    Recomputes entity_stats & entity_sources from metadata_logs. For databases
+    written before the Scoreboard existed, or by tools that bypass SignalWriter.
     """
-    The Universal Socket.
+    conn.create_function('source_key', 1, source_key, deterministic=True)
+    conn.execute("DELETE FROM entity_sources")
+    conn.execute("DELETE FROM entity_stats")
+    conn.execute('''
+        INSERT INTO entity_stats (sovereign_id, signal_count, first_seen, last_seen)
+        SELECT sovereign_id, SUM(occurrences), MIN(first_seen), MAX(last_seen) FROM signal_evidence
+        WHERE sovereign_id IS NOT NULL GROUP BY sovereign_id
+    ''')
+    conn.execute('''
+        INSERT OR IGNORE INTO entity_sources (sovereign_id, source_key)
+        SELECT sovereign_id, source_key(context) FROM signal_evidence WHERE sovereign_id IS NOT NULL
+    ''')
+    # Latest evidence: the row whose last occurrence is most recent
+    conn.execute('''
+        UPDATE entity_stats SET last_log_id =
+            (SELECT id FROM signal_evidence e WHERE e.sovereign_id = entity_stats.sovereign_id
+             ORDER BY last_seen DESC, id DESC LIMIT 1)
+    ''')
+    conn.execute('''
+        UPDATE entity_stats SET last_context =
+            (SELECT evidence FROM signal_evidence WHERE id = entity_stats.last_log_id)
+    ''')
+    conn.execute("INSERT OR IGNORE INTO entity_stats (sovereign_id) SELECT sovereign_id FROM entities")
+
+def intern_contexts(cursor, contexts, cache=None):
+    """
+    Looks up (adding when new) each context string in log_contexts.
+    Returns: {context: context_id}; `cache` carries known ids between calls.
+    """
+    cache = {} if cache is None else cache
+    new = [context for context in set(contexts) if context not in cache]
+    if new:
+        cursor.executemany("INSERT OR IGNORE INTO log_contexts (context) VALUES (?)", ((c,) for c in new))
+        for start in range(0, len(new), 500):
+            part = new[start:start + 500]
+            cursor.execute(f"SELECT context, id FROM log_contexts WHERE context IN ({','.join('?' * len(part))})", part)
+            cache.update(cursor.fetchall())
+    return cache
+
+# --- CONNECTION MANAGER ---
+# One Host ingest writer and many Hunter Nodes share people.db: WAL lets
+# readers run alongside the writer, and writers queue on the busy timeout.
+BUSY_TIMEOUT_MS = 30000
+CACHE_SIZE_KB = 65536            # Page cache per connection
+MMAP_SIZE = 256 * 1024 * 1024    # Memory-mapped reads
+WRITE_RETRIES = 6                # Attempts before a locked write gives up
+RETRY_BACKOFF = 0.05             # Seconds; doubles per attempt
+
+_local = threading.local()
+
+def _open(path):
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_MS / 1000)
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")  # Durable at checkpoints; safe under WAL
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    ensure_schema(conn)
+    return conn
+
+def connect(db_name=None):
+    """
+    The Substrate handle for this thread: one reusable, tuned WAL connection
+    per (thread, database). Callers must not close it; see release().
+    """
+    path = os.path.abspath(db_name or DB_NAME)
+    conns = _local.__dict__.setdefault('conns', {})
+    ino = os.stat(path).st_ino if os.path.exists(path) else None
+    entry = conns.get(path)
+    # Re-open after a fork or when the file was wiped and rebuilt underneath us
+    if entry is None or entry[1] != os.getpid() or entry[2] != ino:
+        conn = _open(path)
+        entry = conns[path] = (conn, os.getpid(), os.stat(path).st_ino)
+    return entry[0]
+
+def release(db_name=None):
+    """Closes this thread's connections (all, or just `db_name`'s)."""
+    conns = _local.__dict__.get('conns', {})
+    paths = [os.path.abspath(db_name)] if db_name else list(conns)
+    for path in paths:
+        entry = conns.pop(path, None)
+        if entry and entry[1] == os.getpid(): entry[0].close()
+
+def _locked(e):
+    return isinstance(e, sqlite3.OperationalError) and ('locked' in str(e) or 'busy' in str(e))
+
+def write_transaction(fn, db_name=None):
+    """
+    Runs fn(cursor) in a BEGIN IMMEDIATE transaction and commits, retrying
+    with backoff while another node holds the write lock. If this thread
+    already has a transaction open, fn joins it and the owner commits.
+    """
+    conn = connect(db_name)
+    if conn.in_transaction: return fn(conn.cursor())
+    for attempt in range(WRITE_RETRIES):
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            result = fn(conn.cursor())
+            conn.commit()
+            return result
+        except Exception as e:
+            if conn.in_transaction: conn.rollback()
+            if not _locked(e) or attempt == WRITE_RETRIES - 1: raise
+            METRICS.count('sqlite.lock_retries')
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+def get_state(cursor, key, default=None):
+    cursor.execute("SELECT value FROM core_state WHERE key = ?", (key,))
+    row = cursor.fetchone()
+    return row[0] if row else default
+
+def set_state(cursor, key, value):
+    cursor.execute("INSERT OR REPLACE INTO core_state (key, value) VALUES (?, ?)", (key, str(value)))
+
+# --- WRITER SETTINGS ---
+BATCH_SIZE = 5000       # Signals per transaction
+CONTEXT_CACHE = 100000  # Interned context ids a writer remembers
+
+def resolve_signal(value, signal_type):
+    """
+    Derives the Sovereign Anchor for a raw signal.
+    Returns: (value, sovereign_id, display_name, entity_type)
     """
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
     value = value.strip()
-    
     if signal_type == 'email':
         value = value.lower()
         sov_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, value))[:8]
@@ -69,93 +412,482 @@ def ingest_signal(value, signal_type, context, source_module):
         sov_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, value.lower()))[:8]
         display_name = value
         entity_type = classify_entity(value)
+    return value, sov_id, display_name, entity_type
+
+class SignalWriter:
+    """
+    The Batched Socket.
+    Buffers entity upserts and provenance rows, then flushes them with
+    executemany in one write_transaction per batch. Locks are retried by
+    write_transaction; once it gives up, the batch is dropped and the error
+    raised. Re-entrant: nested `with` blocks share one writer; the outermost
+    flushes it.
+    """
+    def __init__(self, db_name=None, batch_size=BATCH_SIZE):
+        self.db_name = db_name or DB_NAME
+        self.batch_size = max(1, batch_size)
+        self._depth = 0
+        self._entities = []
+        self._logs = []
+        self._seen = set()  # Sovereign IDs already upserted this session
+        self._epoch = None  # heal_epoch _seen was built under (see merge_identities)
+        self._staged = []   # (sql, params) riding along in the next flush
+        self._contexts = {} # context -> log_contexts id (see intern_contexts)
+
+    def __enter__(self):
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._depth -= 1
+        if self._depth > 0: return False
+        try:
+            if exc_type is None: self.flush()
+        finally:
+            self.close()
+        return False
+
+    def write(self, value, signal_type, context, source_module):
+        """Buffers one signal. Returns True once it is queued."""
+        start = time.perf_counter()
+        value, sov_id, display_name, entity_type = resolve_signal(value, signal_type)
+        METRICS.timers['uuid_hash'] += time.perf_counter() - start
+        METRICS.counters[f"signals.{signal_type}"] += 1
+        if sov_id not in self._seen:
+            self._entities.append((sov_id, display_name, entity_type, 'Discovery'))
+            self._seen.add(sov_id)
+        details = f"{sov_id} :: Type: {signal_type} | Value: {value}"  # Context is interned
+        self._logs.append((source_module, details, sov_id, signal_type, value, context or ''))
+        if len(self._logs) >= self.batch_size: self.flush()
+        return True
+
+    def write_many(self, signals, source_module):
+        """Buffers (value, signal_type, context) tuples. Returns the count queued."""
+        count = 0
+        for value, signal_type, context in signals:
+            self.write(value, signal_type, context, source_module)
+            count += 1
+        return count
+
+    def stage(self, sql, params):
+        """Queues an extra statement to commit atomically with the next flush."""
+        self._staged.append((sql, params))
 
+    def _anchors(self, cursor):
+        """
+        Entity upserts for this batch. A heal since the last flush may have
+        merged away anchors in _seen, so every anchor the batch touches is
+        re-upserted and _seen restarts from it.
+        Returns: (rows, new _seen or None, epoch) for flush() to adopt
+        """
+        epoch = get_state(cursor, 'heal_epoch', '0')
+        # First flush: _seen is this batch alone, nothing to go stale
+        if self._epoch in (None, epoch): return self._entities, None, epoch
+        anchors = {}
+        for _, _, sov_id, signal_type, value, _ in self._logs:
+            if sov_id not in anchors: anchors[sov_id] = resolve_signal(value, signal_type)[1:]
+        for sov_id, display_name, entity_type, status in self._entities:
+            anchors.setdefault(sov_id, (sov_id, display_name, entity_type))
+        return [(*anchor, 'Discovery') for anchor in anchors.values()], set(anchors), epoch
+
+    def _apply(self, cursor):
+        """
+        One attempt at the batch. write_transaction re-runs it after a locked
+        rollback, so the writer's caches are read here but never changed.
+        Returns: (newly interned context ids, new _seen or None, heal_epoch)
+        """
+        contexts = ChainMap({}, self._contexts)  # New ids land in maps[0]
+        with METRICS.stage('sqlite_write'):
+            entities, seen, epoch = self._anchors(cursor)
+            cursor.executemany('''
+                INSERT INTO entities (sovereign_id, display_name, entity_type, status)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(sovereign_id) DO UPDATE SET status = status
+            ''', entities)
+            if self._logs:
+                self._apply_logs(cursor, contexts)
+                self._apply_stats(cursor, contexts)
+            for sql, params in self._staged:
+                cursor.execute(sql, params)
+        return contexts.maps[0], seen, epoch
+
+    def _apply_logs(self, cursor, contexts):
+        """
+        Compaction at write time: repeats of a (sovereign_id, type, value,
+        context) add to one row's occurrence count instead of appending rows.
+        """
+        ids = intern_contexts(cursor, (log[5] for log in self._logs), contexts)
+        rows = {}
+        for module, details, sov_id, signal_type, value, context in self._logs:
+            key = (sov_id, signal_type, value, ids[context])
+            if key in rows: rows[key][-1] += 1
+            else: rows[key] = [module, details, *key, 1]
+        cursor.executemany('''
+            INSERT INTO metadata_logs
+                (action, module, details, sovereign_id, signal_type, signal_value, context_id, occurrences, last_seen)
+            VALUES ('SIGNAL_MINED', ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT (sovereign_id, signal_type, signal_value, context_id)
+                WHERE action = 'SIGNAL_MINED' AND context_id IS NOT NULL
+            DO UPDATE SET occurrences = occurrences + excluded.occurrences, last_seen = excluded.last_seen
+        ''', rows.values())
+
+    def _apply_stats(self, cursor, contexts):
+        """Folds this batch into entity_stats & entity_sources, one row per Entity."""
+        stats, sources = {}, set()
+        for _, details, sov_id, signal_type, value, context in self._logs:
+            count = stats[sov_id][0] + 1 if sov_id in stats else 1
+            stats[sov_id] = (count, (sov_id, signal_type, value, context), details)
+            sources.add((sov_id, source_key(context)))
+        rows = []
+        for sov_id, (count, (_, signal_type, value, context), details) in stats.items():
+            # The row holding this Entity's latest occurrence (a new row or a bumped one)
+            cursor.execute('''
+                SELECT id FROM metadata_logs WHERE sovereign_id = ? AND signal_type = ? AND signal_value = ?
+                AND context_id = ? AND action = 'SIGNAL_MINED'
+            ''', (sov_id, signal_type, value, contexts[context]))
+            evidence = f"{details.split(' :: ', 1)[-1]} | Context: {context}"
+            rows.append((sov_id, count, cursor.fetchone()[0], evidence))
+        cursor.executemany('''
+            INSERT INTO entity_stats
+                (sovereign_id, signal_count, source_count, first_seen, last_seen, last_log_id, last_context)
+            VALUES (?, ?, 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, ?, ?)
+            ON CONFLICT(sovereign_id) DO UPDATE SET
+                signal_count = signal_count + excluded.signal_count,
+                first_seen = COALESCE(first_seen, excluded.first_seen),
+                last_seen = excluded.last_seen,
+                last_log_id = excluded.last_log_id,
+                last_context = excluded.last_context
+        ''', rows)
+        # New pairs bump source_count via trg_sources_count
+        cursor.executemany("INSERT OR IGNORE INTO entity_sources (sovereign_id, source_key) VALUES (?, ?)",
+                           sources)
+
+    def flush(self):
+        """Writes the buffers in a single transaction."""
+        if not self._logs and not self._entities and not self._staged: return
+        try:
+            with METRICS.stage('sqlite_commit'):
+                contexts, seen, epoch = write_transaction(self._apply, self.db_name)
+            METRICS.count('sqlite.transactions')
+        except:
+            # The batch is dropped. Un-see its anchors so signals written again
+            # re-upsert them
+            self._seen.difference_update(e[0] for e in self._entities)
+            raise
+        else:
+            # Committed: only now do the attempt's ids & anchors become the writer's
+            if len(self._contexts) + len(contexts) > CONTEXT_CACHE: self._contexts.clear()
+            self._contexts.update(contexts)
+            if seen is not None: self._seen = seen
+            self._epoch = epoch
+        finally:
+            self._entities = []
+            self._logs = []
+            self._staged = []
+
+    def close(self):
+        self._depth = 0
+
+def ingest_signal(value, signal_type, context, source_module):
+    """
+    The Universal Socket. Single-signal wrapper around SignalWriter.
+    """
     try:
-        cursor.execute('''
-            INSERT INTO entities (sovereign_id, display_name, entity_type, status)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(sovereign_id) DO UPDATE SET status = status
-        ''', (sov_id, display_name, entity_type, 'Discovery'))
-        
-        details = f"{sov_id} :: Type: {signal_type} | Value: {value} | Context: {context}"
-        cursor.execute('''
-            INSERT INTO metadata_logs (action, module, details)
-            VALUES (?, ?, ?)
-        ''', ('SIGNAL_MINED', source_module, details))
-        conn.commit()
+        with SignalWriter(batch_size=1) as writer:
+            writer.write(value, signal_type, context, source_module)
         return True
     except: 
         return False
-    finally:
-        conn.close()
 
-def self_heal_network():
+def record_run(target, started, seconds, profile_path=None):
     """
-    The Merger. Collapses duplicate emails into single Sovereign IDs.
+    Persists METRICS for one ingest run to `ingest_runs` and a JSON report.
+    Returns: the report path.
     """
-    if not os.path.exists(DB_NAME): return
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    
-    print("\n  [🧠 Core] Running Self-Healing Logic...")
+    snap = METRICS.snapshot()
+    signals = sum(v for k, v in snap['counters'].items() if k.startswith('signals.'))
+    report = {
+        'target': target,
+        'started_at': started.isoformat(timespec='seconds'),
+        'seconds': round(seconds, 4),
+        'signals': signals,
+        'signals_per_sec': round(signals / seconds, 1) if seconds else 0.0,
+        'timers': {k: round(v, 4) for k, v in sorted(snap['timers'].items())},
+        'counters': dict(sorted(snap['counters'].items())),
+        'profile': profile_path,
+    }
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    # Microseconds: a resumed job can start in the same second as the cancelled one
+    path = os.path.join(REPORT_DIR, f"ingest_{started:%Y%m%d_%H%M%S_%f}.json")
+    with open(path, 'w') as f: json.dump(report, f, indent=2)
     
-    # Merge Logic (Simplified for 2030)
+    try:
+        write_transaction(lambda cursor: cursor.execute('''
+            INSERT INTO ingest_runs (started_at, target, seconds, signals, signals_per_sec, report)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (report['started_at'], target, report['seconds'], signals,
+              report['signals_per_sec'], json.dumps(report))))
+    except sqlite3.Error: pass # Substrate not initialized; the JSON report still stands
+    return path
+
+def merge_identities(cursor, mapping, reason='Shared Email'):
+    """
+    Set-based merge. `mapping` is {dup_id: primary_id}; loaded into a temp
+    table and applied with one statement per table. Every merge is logged
+    as IDENTITY_MERGED on the primary, with the duplicate's name & `reason`.
+    """
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS heal_map (dup_id TEXT PRIMARY KEY, primary_id TEXT)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS temp.idx_heal_primary ON heal_map (primary_id)")
+    cursor.execute("DELETE FROM heal_map")
+    if not mapping: return 0
+    cursor.executemany("INSERT INTO heal_map (dup_id, primary_id) VALUES (?, ?)", mapping.items())
+    _fold_collisions(cursor)
     cursor.execute('''
-        SELECT substr(details, instr(details, 'Value: ') + 7, 
-               instr(substr(details, instr(details, 'Value: ') + 7), ' |') - 1) as email_val,
-               GROUP_CONCAT(DISTINCT substr(details, 1, instr(details, ' ::') - 1)) as ids
-        FROM metadata_logs
-        WHERE details LIKE '%Type: email%'
-        GROUP BY email_val
-        HAVING COUNT(DISTINCT substr(details, 1, instr(details, ' ::') - 1)) > 1
+        UPDATE metadata_logs SET
+            details = REPLACE(details, sovereign_id,
+                              (SELECT primary_id FROM heal_map WHERE dup_id = metadata_logs.sovereign_id)),
+            sovereign_id = (SELECT primary_id FROM heal_map WHERE dup_id = metadata_logs.sovereign_id)
+        WHERE sovereign_id IN (SELECT dup_id FROM heal_map)
     ''')
-    
-    merges = cursor.fetchall()
-    count = 0
-    for email, id_list in merges:
-        ids = id_list.split(',')
-        primary_id = ids[0]
-        for dup_id in ids[1:]:
-            cursor.execute("UPDATE metadata_logs SET details = REPLACE(details, ?, ?) WHERE details LIKE ?", 
-                           (dup_id, primary_id, f"{dup_id}%"))
-            cursor.execute("DELETE FROM entities WHERE sovereign_id = ?", (dup_id,))
-            count += 1
-    
+    _merge_stats(cursor)
+    cursor.execute('''
+        INSERT INTO metadata_logs (action, module, details, sovereign_id)
+        SELECT 'IDENTITY_MERGED', 'people_core',
+               m.primary_id || ' :: Merged ' || m.dup_id || ' (' || COALESCE(e.display_name, '?') || ') | Reason: ' || ?,
+               m.primary_id
+        FROM heal_map m LEFT JOIN entities e ON e.sovereign_id = m.dup_id
+        ORDER BY m.primary_id, m.dup_id
+    ''', (reason,))
+    cursor.execute("DELETE FROM entities WHERE sovereign_id IN (SELECT dup_id FROM heal_map)")
+    # Open SignalWriters see the bump and stop trusting their cached anchors
+    set_state(cursor, 'heal_epoch', int(get_state(cursor, 'heal_epoch', 0)) + 1)
+    cursor.execute("DELETE FROM entity_keys WHERE sovereign_id IN (SELECT dup_id FROM heal_map)")
+    cursor.execute("DELETE FROM entity_lsh WHERE sovereign_id IN (SELECT dup_id FROM heal_map)")
+    return len(mapping)
+
+def _fold_collisions(cursor):
+    """
+    Compacted rows are unique per (sovereign_id, type, value, context). Rows
+    that will share a key once duplicates become their primary are folded into
+    the newest of them first, summing occurrences.
+    """
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS heal_fold (id INTEGER PRIMARY KEY, keep_id INTEGER, sov_id TEXT)")
+    cursor.execute("DELETE FROM heal_fold")
+    cursor.execute('''
+        INSERT INTO heal_fold (id, keep_id, sov_id)
+        SELECT l.id, MAX(l.id) OVER (PARTITION BY COALESCE(m.primary_id, l.sovereign_id),
+                                                  l.signal_type, l.signal_value, l.context_id),
+               l.sovereign_id
+        FROM metadata_logs l LEFT JOIN heal_map m ON m.dup_id = l.sovereign_id
+        WHERE l.sovereign_id IN (SELECT dup_id FROM heal_map UNION SELECT primary_id FROM heal_map)
+          AND l.action = 'SIGNAL_MINED' AND l.context_id IS NOT NULL
+    ''')
+    cursor.execute("DELETE FROM heal_fold WHERE id = keep_id")
+    cursor.execute('''
+        UPDATE metadata_logs SET
+            occurrences = occurrences + (SELECT SUM(l.occurrences) FROM heal_fold f
+                                         JOIN metadata_logs l ON l.id = f.id WHERE f.keep_id = metadata_logs.id),
+            timestamp = MIN(timestamp, (SELECT MIN(l.timestamp) FROM heal_fold f
+                                        JOIN metadata_logs l ON l.id = f.id WHERE f.keep_id = metadata_logs.id)),
+            last_seen = MAX(COALESCE(last_seen, timestamp),
+                            (SELECT MAX(COALESCE(l.last_seen, l.timestamp)) FROM heal_fold f
+                             JOIN metadata_logs l ON l.id = f.id WHERE f.keep_id = metadata_logs.id))
+        WHERE id IN (SELECT keep_id FROM heal_fold)
+    ''')
+    cursor.execute('''
+        UPDATE entity_stats SET last_log_id = (SELECT keep_id FROM heal_fold WHERE id = entity_stats.last_log_id)
+        WHERE sovereign_id IN (SELECT sov_id FROM heal_fold) AND last_log_id IN (SELECT id FROM heal_fold)
+    ''')
+    cursor.execute("DELETE FROM metadata_logs WHERE id IN (SELECT id FROM heal_fold)")
+
+def _merge_stats(cursor):
+    """Folds every heal_map duplicate's entity_stats & sources into its primary."""
+    cursor.execute("INSERT OR IGNORE INTO entity_stats (sovereign_id) SELECT primary_id FROM heal_map")
+    # Latest evidence across the primary & its duplicates, before last_seen is merged
+    cursor.execute('''
+        UPDATE entity_stats SET (last_log_id, last_context) =
+            (SELECT s.last_log_id, s.last_context FROM entity_stats s
+             WHERE s.sovereign_id = entity_stats.sovereign_id
+                OR s.sovereign_id IN (SELECT dup_id FROM heal_map WHERE primary_id = entity_stats.sovereign_id)
+             ORDER BY s.last_seen DESC, s.last_log_id DESC LIMIT 1)
+        WHERE sovereign_id IN (SELECT primary_id FROM heal_map)
+    ''')
+    cursor.execute('''
+        UPDATE entity_stats SET
+            signal_count = signal_count + (SELECT COALESCE(SUM(s.signal_count), 0) FROM entity_stats s
+                                           JOIN heal_map m ON m.dup_id = s.sovereign_id
+                                           WHERE m.primary_id = entity_stats.sovereign_id),
+            first_seen = (SELECT MIN(s.first_seen) FROM entity_stats s
+                          WHERE s.sovereign_id = entity_stats.sovereign_id
+                             OR s.sovereign_id IN (SELECT dup_id FROM heal_map WHERE primary_id = entity_stats.sovereign_id)),
+            last_seen = (SELECT MAX(s.last_seen) FROM entity_stats s
+                         WHERE s.sovereign_id = entity_stats.sovereign_id
+                            OR s.sovereign_id IN (SELECT dup_id FROM heal_map WHERE primary_id = entity_stats.sovereign_id))
+        WHERE sovereign_id IN (SELECT primary_id FROM heal_map)
+    ''')
+    # New (primary, source) pairs bump source_count via trg_sources_count
+    cursor.execute('''
+        INSERT OR IGNORE INTO entity_sources (sovereign_id, source_key)
+        SELECT m.primary_id, s.source_key FROM entity_sources s JOIN heal_map m ON m.dup_id = s.sovereign_id
+    ''')
+    cursor.execute("DELETE FROM entity_sources WHERE sovereign_id IN (SELECT dup_id FROM heal_map)")
+    cursor.execute("DELETE FROM entity_stats WHERE sovereign_id IN (SELECT dup_id FROM heal_map)")
+
+def _collapse(claims):
+    """
+    Union-find over (value, sovereign_id, rank) claims.
+    Every group collapses onto its earliest-seen (lowest rank) ID.
+    """
+    parent, rank = {}, {}
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    firsts = {}
+    for value, sov_id, first_id in claims:
+        parent.setdefault(sov_id, sov_id)
+        rank[sov_id] = first_id
+        if value not in firsts:
+            firsts[value] = sov_id
+            continue
+        a, b = find(firsts[value]), find(sov_id)
+        if a == b: continue
+        if (rank[b], b) < (rank[a], a): a, b = b, a
+        parent[b] = a
+    return {x: find(x) for x in parent if find(x) != x}
+
+def self_heal_network(full=False):
+    """
+    The Merger. Collapses duplicate emails into single Sovereign IDs, then
+    near-duplicate names (people_resolve). Incremental: only signals logged
+    since the last heal are re-examined; `full` re-examines everything.
+    """
+    if not os.path.exists(DB_NAME): return
+    import people_resolve
+    print("\n  [🧠 Core] Running Self-Healing Logic...")
+    count = write_transaction(lambda cursor: _heal(cursor, full))
     if count > 0:
         print(f"  [+] Healed {count} fractured identities.")
+    count = write_transaction(lambda cursor: people_resolve.resolve(cursor, full))
+    if count > 0:
+        print(f"  [+] Resolved {count} near-duplicate names.")
+
+def _heal(cursor, full):
+    watermark = 0 if full else int(get_state(cursor, 'heal_watermark', 0))
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM metadata_logs")
+    high = cursor.fetchone()[0]
     
-    conn.commit()
-    conn.close()
+    # Contested emails: touched since the watermark and claimed by 2+ IDs
+    # Unary + keeps `touched` on the id range instead of the signal_type index
+    cursor.execute('''
+        WITH touched AS (
+            SELECT DISTINCT signal_value FROM metadata_logs
+            WHERE +signal_type = 'email' AND id > ? AND id <= ?
+        ),
+        contested AS (
+            SELECT l.signal_value FROM metadata_logs l
+            JOIN touched t ON t.signal_value = l.signal_value
+            WHERE l.signal_type = 'email'
+            GROUP BY l.signal_value
+            HAVING COUNT(DISTINCT l.sovereign_id) > 1
+        )
+        SELECT DISTINCT l.signal_value, l.sovereign_id,
+               (SELECT MIN(id) FROM metadata_logs WHERE sovereign_id = l.sovereign_id) AS first_id
+        FROM metadata_logs l
+        JOIN contested c ON c.signal_value = l.signal_value
+        WHERE l.signal_type = 'email'
+        ORDER BY l.signal_value, first_id
+    ''', (watermark, high))
+    
+    count = merge_identities(cursor, _collapse(cursor.fetchall()))
+    set_state(cursor, 'heal_watermark', high)
+    return count
+
+COMPACT_CHUNK = 20000  # Legacy rows folded per transaction
+
+def compact_logs(db_name=None):
+    """
+    The Compactor. Folds legacy SIGNAL_MINED rows (one row per occurrence,
+    context inside `details`) into the compacted layout SignalWriter writes.
+    Online: short transactions, so ingest and the Hunter carry on alongside.
+    Returns: rows removed
+    """
+    if not os.path.exists(db_name or DB_NAME): return 0
+    print("\n  [🧹 Core] Compacting Provenance...")
+    after = removed = 0
+    while after is not None:
+        after, dropped = write_transaction(lambda cursor: _compact_chunk(cursor, after), db_name)
+        removed += dropped
+    print(f"  [+] Folded {removed} repeated log rows.")
+    return removed
+
+def _compact_chunk(cursor, after):
+    """Compacts the next COMPACT_CHUNK legacy rows after id `after`. Returns: (last id or None, rows removed)"""
+    cursor.execute('''
+        SELECT id, timestamp, details, sovereign_id, signal_type, signal_value FROM metadata_logs
+        WHERE id > ? AND action = 'SIGNAL_MINED' AND context_id IS NULL AND signal_type IS NOT NULL
+          AND instr(details, ' | Context: ') > 0
+        ORDER BY id LIMIT ?
+    ''', (after, COMPACT_CHUNK))
+    rows = cursor.fetchall()
+    if not rows: return None, 0
+    groups = {}
+    for log_id, stamp, details, sov_id, signal_type, value in rows:
+        head, _, context = details.partition(' | Context: ')
+        groups.setdefault((sov_id, signal_type, value, context), []).append((log_id, stamp, head))
+    ids = intern_contexts(cursor, (key[3] for key in groups))
+    keep, drop = [], []
+    for (sov_id, signal_type, value, context), hits in groups.items():
+        cursor.execute('''
+            SELECT id FROM metadata_logs WHERE sovereign_id = ? AND signal_type = ? AND signal_value = ?
+            AND context_id = ? AND action = 'SIGNAL_MINED'
+        ''', (sov_id, signal_type, value, ids[context]))
+        existing = cursor.fetchone()
+        survivor = existing[0] if existing else max(h[0] for h in hits)
+        first, last = min(h[1] for h in hits), max(h[1] for h in hits)
+        if existing:
+            cursor.execute('''
+                UPDATE metadata_logs SET occurrences = occurrences + ?, timestamp = MIN(timestamp, ?),
+                    last_seen = MAX(COALESCE(last_seen, timestamp), ?)
+                WHERE id = ?
+            ''', (len(hits), first, last, survivor))
+        else:
+            keep.append((hits[-1][2], ids[context], len(hits), first, last, survivor))
+        drop.extend((sov_id, survivor, h[0]) for h in hits if h[0] != survivor)
+    cursor.executemany('''
+        UPDATE metadata_logs SET details = ?, context_id = ?, occurrences = ?, timestamp = ?, last_seen = ?
+        WHERE id = ?
+    ''', keep)
+    # Keep the Scoreboard's evidence pointers on live rows
+    cursor.executemany("UPDATE entity_stats SET last_log_id = ? WHERE sovereign_id = ? AND last_log_id = ?",
+                       ((survivor, sov_id, log_id) for sov_id, survivor, log_id in drop))
+    cursor.executemany("DELETE FROM metadata_logs WHERE id = ?", ((log_id,) for _, _, log_id in drop))
+    return rows[-1][0], len(drop)
+
 def log_action(action, details):
     """
     Standardized logging for the Hunter Node.
     """
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    cursor.execute('''
-        INSERT INTO metadata_logs (action, module, details)
-        VALUES (?, ?, ?)
-    ''', (action, 'people_node', details))
-    conn.commit()
-    conn.close()
+    sov_id = details.split(' :: ')[0] if ' :: ' in details else None
+    write_transaction(lambda cursor: cursor.execute('''
+        INSERT INTO metadata_logs (action, module, details, sovereign_id)
+        VALUES (?, ?, ?, ?)
+    ''', (action, 'people_node', details, sov_id)))
 
 # --- CORE: MENU FETCHERS ---
 def get_archetypes():
     """Returns list of (id, name) for the Hunter Menu."""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
     try:
+        cursor = connect().cursor()
         cursor.execute("SELECT id, name FROM archetypes ORDER BY id")
         return cursor.fetchall()
     except: return []
-    finally: conn.close()
 
 def get_domains():
     """Returns list of unique Domains for the Hunter Menu."""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
     try:
+        cursor = connect().cursor()
         cursor.execute("SELECT DISTINCT domain FROM chart_of_accounts ORDER BY domain")
         return [row[0] for row in cursor.fetchall()]
     except: return []
-    finally: conn.close()
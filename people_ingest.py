@@ -1,118 +1,581 @@
 import os
-import pandas as pd
-import PyPDF2
-from docx import Document
-import email
-from email import policy
+import time
+import hashlib
+import threading
+from datetime import datetime
+from itertools import chain, islice
 import people_core as core # The Brain
 
-def process_linkedin(path):
+# Parsers (pandas, PyPDF2, python-docx, openpyxl, email) are imported inside
+# the miners that need them, so only the file type being ingested pays its load.
+
+# --- MINER SETTINGS ---
+POOL_WORKERS = os.cpu_count() or 1  # Parser processes for the pool miners
+MAIL_CHUNK = 64                     # Messages per pool task
+QUEUE_DEPTH = 4                     # In-flight tasks per worker (backpressure)
+PDF_PARALLEL_PAGES = 200            # Fan PDFs this long out to the pool
+PDF_CHUNK = 25                      # Pages per pool task
+CSV_CHUNK = 50000                   # Rows per read_csv chunk
+DEDUP_LIMIT = 1000000               # Distinct signals remembered per file across chunks
+SHEET_SAMPLE = 500                  # Rows sampled for spreadsheet column detection
+SHEET_THRESHOLD = 0.5               # Share of sampled cells a column must match
+SCAN_BATCH = 1000                   # Document lines per gravity batch
+
+# Header hints for the Universal Spreadsheet
+FIRST_HEADERS = ('first', 'given')
+LAST_HEADERS = ('last', 'surname', 'family')
+NAME_HEADERS = ('name', 'contact', 'attendee', 'person')
+ORG_HEADERS = ('company', 'organization', 'organisation', 'employer', 'account', 'firm', 'institution')
+
+def _scan_tree(path):
+    """os.scandir walk. Yields every file path below `path`."""
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False): stack.append(entry.path)
+                    elif entry.is_file(): yield entry.path
+        except OSError: continue
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f_obj:
+        for block in iter(lambda: f_obj.read(1 << 20), b''): h.update(block)
+    return h.hexdigest()
+
+class Manifest:
+    """
+    The Ledger. Remembers (size, mtime, content hash) per ingested path so a
+    re-run only mines what changed. Marks are staged on the writer, so a file
+    is recorded in the same transaction as its signals.
+    """
+    def __init__(self, writer, force=False, rehash=False):
+        self.writer = writer
+        self.force = force    # Ignore the ledger, re-mine everything
+        self.rehash = rehash  # Trust content hashes only, not size/mtime
+        self._rows = None
+        self._digests = {}
+
+    def _load(self):
+        try:
+            rows = core.connect(self.writer.db_name).execute(
+                "SELECT path, size, mtime, content_hash FROM ingest_manifest")
+            self._rows = {path: (size, mtime, digest) for path, size, mtime, digest in rows}
+        except: self._rows = {}
+
+    def is_current(self, path, st=None):
+        """True if `path` was ingested before and has not changed since."""
+        if self.force: return False
+        if self._rows is None: self._load()
+        path = os.path.abspath(path)
+        rec = self._rows.get(path)
+        if rec is None: return False
+        st = st or os.stat(path)
+        if not self.rehash and (st.st_size, st.st_mtime) == rec[:2]:
+            core.METRICS.count('files.unchanged')
+            return True
+        with core.METRICS.stage('content_hash'):
+            digest = self._digests[path] = file_hash(path)
+        if digest != rec[2]: return False
+        self.mark(path, st, digest) # Touched but identical: refresh the stat
+        core.METRICS.count('files.unchanged')
+        return True
+
+    def mark(self, path, st=None, digest=None):
+        path = os.path.abspath(path)
+        st = st or os.stat(path)
+        digest = digest or self._digests.pop(path, None) or file_hash(path)
+        self.writer.stage('''
+            INSERT OR REPLACE INTO ingest_manifest (path, size, mtime, content_hash, ingested_at)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ''', (path, st.st_size, st.st_mtime, digest))
+        if self._rows is not None: self._rows[path] = (st.st_size, st.st_mtime, digest)
+
+class Progress:
+    """
+    Live counters for one router() run, safe to read from another thread.
+    cancel() stops the run at the next file boundary; files already mined
+    are in the Ledger, so re-running the same path resumes where it left off.
+    """
+    def __init__(self):
+        self.files_total = 0
+        self.files_done = 0
+        self.signals = 0
+        self.started = time.time()
+        self._cancel = threading.Event()
+
+    def cancel(self): self._cancel.set()
+
+    @property
+    def cancelled(self): return self._cancel.is_set()
+
+    def add_total(self, files): self.files_total += files
+
+    def advance(self, files=1, signals=0):
+        self.files_done += files
+        self.signals += signals or 0
+
+    def snapshot(self):
+        """Returns: dict of files done/total, signals, signals/sec and ETA seconds (or None)."""
+        elapsed = max(time.time() - self.started, 1e-6)
+        left = self.files_total - self.files_done
+        eta = left * elapsed / self.files_done if self.files_done and left > 0 else None
+        return {'files_done': self.files_done, 'files_total': self.files_total,
+                'signals': self.signals, 'signals_per_sec': self.signals / elapsed,
+                'elapsed': elapsed, 'eta': eta, 'cancelled': self.cancelled}
+
+def _chunked(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk: yield chunk
+
+def _metered(fn, *args):
+    """
+    Pool task wrapper: runs the task and returns (result, snapshot). The worker
+    process's METRICS is its own, so it is drained per task, never swapped.
+    """
+    core.METRICS.reset()  # A forked worker starts with a copy of the parent's
+    result = fn(*args)
+    return result, core.METRICS.drain()
+
+def _bounded_map(fn, tasks, workers):
+    """
+    Ordered-as-completed map over a process pool with at most
+    workers * QUEUE_DEPTH tasks in flight. Runs inline when workers <= 1.
+    Each worker's Telemetry is merged back into this process's METRICS;
+    inline tasks record straight into it.
+    """
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+    if workers <= 1:
+        for task in tasks: yield fn(*task)
+        return
+    context = None
+    if os.name == 'posix' and threading.current_thread() is not threading.main_thread():
+        # Background job: forking a threaded process can copy held locks
+        import multiprocessing
+        context = multiprocessing.get_context('forkserver')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        pending = set()
+        def drain(done):
+            for fut in done:
+                result, snap = fut.result()
+                core.METRICS.merge(snap)
+                yield result
+        for task in tasks:
+            pending.add(pool.submit(_metered, fn, *task))
+            if len(pending) >= workers * QUEUE_DEPTH:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from drain(done)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from drain(done)
+
+def _read_headers(f_obj):
+    """Reads up to the blank line that ends the header block."""
+    from email import policy
+    from email.parser import BytesParser
+    lines = []
+    for line in f_obj:
+        if line in (b'\n', b'\r\n'): break
+        lines.append(line)
+    return BytesParser(policy=policy.default).parsebytes(b''.join(lines), headersonly=True)
+
+def _mine_message(file_path, headers_only=False):
+    """
+    Parses one message and runs the gravity scan.
+    Returns: (file_path, stat, content_hash, [(value, signal_type, context), ...])
+    Headers-only runs skip the hash: they never mark the manifest.
+    """
+    import email
+    from email import policy
+    signals = []
+    st = digest = None
+    metrics = core.METRICS
+    metrics.count('files.eml')
+    try:
+        with open(file_path, 'rb') as f_obj:
+            st = os.fstat(f_obj.fileno())
+            if headers_only:
+                with metrics.stage('mime_headers'): msg = _read_headers(f_obj)
+            else:
+                data = f_obj.read()
+                with metrics.stage('content_hash'): digest = hashlib.sha256(data).hexdigest()
+                with metrics.stage('mime_parse'): msg = email.message_from_bytes(data, policy=policy.default)
+        subject = str(msg.get('Subject', 'No Subject'))
+        sender = str(msg.get('From', ''))
+        
+        # Mine Header
+        for e in core.EMAIL_REGEX.findall(sender):
+            signals.append((e, 'email', f"Header: {subject[:30]}"))
+        if headers_only: return file_path, st, digest, signals
+        
+        # Mine Body (Simplified Text Extract)
+        parts = []
+        with metrics.stage('mime_decode'):
+            if msg.is_multipart():
+                for part in msg.walk():
+                    if part.get_content_type() == 'text/plain':
+                        parts.append(part.get_payload(decode=True).decode())
+            else:
+                parts.append(msg.get_payload(decode=True).decode())
+        body = ''.join(parts)
+        
+        # Gravity Scan on Body
+        if body:
+            context = f"Email Body: {subject[:30]}"
+            lines = body.split('\n')
+            with metrics.stage('gravity'):
+                for line, valid in zip(lines, core.calculate_gravity_batch(lines)):
+                    if valid: signals.append((line, 'entity_name', context))
+    except: metrics.count('files.failed')
+    return file_path, st, digest, signals
+
+def _mine_messages(paths, headers_only=False):
+    """Pool task: one chunk of messages -> [_mine_message result, ...]"""
+    return [_mine_message(file_path, headers_only) for file_path in paths]
+
+LINKEDIN_COLUMNS = ['First Name', 'Last Name', 'Email Address', 'Company']
+
+def _linkedin_signals(df):
+    """
+    Column-wise LinkedIn Mapping for one chunk.
+    Returns: DataFrame of unique (value, signal_type, context) rows.
+    """
+    import pandas as pd
+    df = df.reindex(columns=LINKEDIN_COLUMNS).fillna('')
+    df = df.apply(lambda col: col.str.strip())
+    full_name = (df['First Name'] + ' ' + df['Last Name']).str.strip()
+    email_addr, company = df['Email Address'], df['Company']
+    
+    names = pd.DataFrame({'value': full_name, 'signal_type': 'entity_name',
+                          'context': 'LinkedIn Export'})[full_name != '']
+    emails = pd.DataFrame({'value': email_addr, 'signal_type': 'email',
+                           'context': 'LinkedIn: ' + full_name})[email_addr.str.contains('@', regex=False)]
+    companies = pd.DataFrame({'value': company, 'signal_type': 'entity_name',
+                              'context': 'LinkedIn Employer: ' + full_name})[company.str.len() > 2]
+    return pd.concat([names, emails, companies], ignore_index=True).drop_duplicates()
+
+def _first_sightings(signals, seen):
+    """
+    (value, signal_type, context) rows not already mined from this file, so
+    repeats count once whichever chunk they land in. `seen` is shared across
+    a file's chunks and reset past DEDUP_LIMIT.
+    """
+    for row in zip(signals['value'], signals['signal_type'], signals['context']):
+        if row in seen: continue
+        if len(seen) >= DEDUP_LIMIT: seen.clear()
+        seen.add(row)
+        yield row
+
+def process_linkedin(path, writer=None, manifest=None):
+    import pandas as pd
     print(f"  [LinkedIn Mode] Parsing {path}...")
+    if manifest and manifest.is_current(path):
+        print("  [=] Unchanged since last ingest. Skipped.")
+        return 0
     # Specialized Logic for LinkedIn Connections
     try:
-        df = pd.read_csv(path, skiprows=3) # Standard LinkedIn skip
-        count = 0
-        for _, row in df.iterrows():
-            # LinkedIn Mapping
-            fname = str(row.get('First Name', ''))
-            lname = str(row.get('Last Name', ''))
-            full_name = f"{fname} {lname}".strip()
-            email_addr = str(row.get('Email Address', ''))
-            company = str(row.get('Company', ''))
-            
-            # Ingest Name
-            if full_name:
-                core.ingest_signal(full_name, 'entity_name', 'LinkedIn Export', 'people_ingest')
-                count += 1
-            # Ingest Email
-            if '@' in email_addr:
-                core.ingest_signal(email_addr, 'email', f"LinkedIn: {full_name}", 'people_ingest')
-                count += 1
-            # Ingest Company
-            if company and len(company) > 2:
-                core.ingest_signal(company, 'entity_name', f"LinkedIn Employer: {full_name}", 'people_ingest')
-                count += 1
+        count, seen = 0, set()
+        chunks = pd.read_csv(path, skiprows=3, dtype=str, chunksize=CSV_CHUNK) # Standard LinkedIn skip
+        with writer or core.SignalWriter() as w:
+            for df in chunks:
+                with core.METRICS.stage('linkedin_map'): signals = _linkedin_signals(df)
+                count += w.write_many(_first_sightings(signals, seen), 'people_ingest')
+            if manifest: manifest.mark(path)
         print(f"  [+] Extracted {count} signals from Graph.")
+        return count
     except Exception as e:
         print(f"  [!] LinkedIn Error: {e}")
 
-def process_document(path):
-    print(f"  [Gravity Mode] Scanning {os.path.basename(path)}...")
-    text = ""
+def _header_is_data(header, body):
+    """
+    Spots a sheet with no header row: its first row reads like the body, i.e.
+    holds an email address or an Entity that passes gravity over a column of
+    Entities. `body` is a DataFrame of the rows below it.
+    """
+    cells = ['' if h is None else f"{h}".strip() for h in header]
+    if any(core.EMAIL_REGEX.search(cell) for cell in cells): return True
+    hints = FIRST_HEADERS + LAST_HEADERS + NAME_HEADERS + ORG_HEADERS + ('mail',)
+    if any(h in cell.lower() for cell in cells for h in hints): return False
+    for i, cell in enumerate(cells[:body.shape[1]]):
+        values = body.iloc[:, i].astype(str).str.strip()
+        values = values[values != '']
+        if not cell or values.empty or not core.calculate_gravity_batch([cell])[0]: continue
+        if sum(core.calculate_gravity_batch(values)) >= SHEET_THRESHOLD * len(values): return True
+    return False
+
+def _iter_sheet_chunks(path):
+    """
+    Streams a spreadsheet as (sheet, DataFrame) pairs of at most CSV_CHUNK
+    string rows. CSV via chunked read_csv; XLSX via openpyxl read-only iter_rows.
+    A first row that looks like data is kept as data, under "Column N" names.
+    """
+    import pandas as pd
+    if not path.lower().endswith('.xlsx'):
+        peek = pd.read_csv(path, dtype=str, header=None, nrows=SHEET_SAMPLE + 1).fillna('')
+        options = {}
+        if not peek.empty and _header_is_data(list(peek.iloc[0]), peek.iloc[1:]):
+            options = dict(header=None, names=[f"Column {i + 1}" for i in range(peek.shape[1])])
+        for df in pd.read_csv(path, dtype=str, chunksize=CSV_CHUNK, **options):
+            yield None, df.fillna('')
+        return
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for ws in wb.worksheets:
+            rows = ws.iter_rows(values_only=True)
+            header = next(rows, None)
+            if not header: continue
+            sample = list(islice(rows, SHEET_SAMPLE))
+            rows = chain(sample, rows)
+            if _header_is_data(header, pd.DataFrame(sample, dtype=object).fillna('')):
+                rows = chain([header], rows)  # Row 1 is a record
+                columns = [f"Column {i + 1}" for i in range(len(header))]
+            else:
+                columns = [f"{h}".strip() if h is not None else f"Column {i + 1}" for i, h in enumerate(header)]
+                columns = [f"{c} ({i + 1})" if columns.index(c) != i else c for i, c in enumerate(columns)]
+            width = len(columns)
+            for chunk in _chunked(rows, CSV_CHUNK):
+                chunk = [tuple(row[:width]) + (None,) * (width - len(row)) for row in chunk]
+                yield ws.title, pd.DataFrame(chunk, columns=columns, dtype=object).fillna('').astype(str)
+    finally: wb.close()
+
+def _detect_columns(df):
+    """
+    Picks email / first / last / full-name / company columns from a sample,
+    using header hints first and the content (EMAIL_REGEX, gravity) second.
+    """
+    import pandas as pd
+    sample = df.head(SHEET_SAMPLE).apply(lambda col: col.str.strip())
+    found = {'email': [], 'first': None, 'last': None, 'name': None, 'org': []}
+    for col in sample.columns:
+        values = sample[col][sample[col] != '']
+        if values.empty: continue
+        header = str(col).lower()
+        if values.str.contains(core.EMAIL_REGEX).mean() >= SHEET_THRESHOLD:
+            found['email'].append(col)
+        elif any(h in header for h in ORG_HEADERS):
+            found['org'].append(col)
+        elif any(h in header for h in FIRST_HEADERS) and found['first'] is None:
+            found['first'] = col
+        elif any(h in header for h in LAST_HEADERS) and found['last'] is None:
+            found['last'] = col
+        elif any(h in header for h in NAME_HEADERS) and found['name'] is None:
+            found['name'] = col
+    if not (found['first'] or found['name'] or found['org']):
+        # No header hints: fall back to the column that looks most like Entities
+        scores = {col: pd.Series(core.calculate_gravity_batch(sample[col][sample[col] != ''])).mean()
+                  for col in sample.columns if col not in found['email'] and (sample[col] != '').any()}
+        best = max(scores, key=scores.get, default=None)
+        if best is not None and scores[best] >= SHEET_THRESHOLD: found['name'] = best
+    return found
+
+def _sheet_signals(df, cols, source):
+    """
+    Column-wise Spreadsheet Mapping for one chunk.
+    Returns: DataFrame of unique (value, signal_type, context) rows.
+    """
+    import pandas as pd
+    df = df.apply(lambda col: col.str.strip())
+    if cols['first'] or cols['last']:
+        parts = [df[c] for c in (cols['first'], cols['last']) if c]
+        full_name = parts[0] if len(parts) == 1 else (parts[0] + ' ' + parts[1]).str.strip()
+    elif cols['name']:
+        full_name = df[cols['name']]
+    else:
+        full_name = pd.Series('', index=df.index)
+    
+    frames = []
+    keep = pd.Series(core.calculate_gravity_batch(full_name), index=df.index, dtype=bool)
+    frames.append(pd.DataFrame({'value': full_name, 'signal_type': 'entity_name',
+                                'context': f"Sheet: {source}"})[keep])
+    for col in cols['email']:
+        found = df[col].str.extract(f"({core.EMAIL_REGEX.pattern})", expand=False).dropna()
+        frames.append(pd.DataFrame({'value': found, 'signal_type': 'email',
+                                    'context': f"Sheet {source}: " + full_name[found.index]}))
+    for col in cols['org']:
+        keep = pd.Series(core.calculate_gravity_batch(df[col]), index=df.index, dtype=bool)
+        frames.append(pd.DataFrame({'value': df[col], 'signal_type': 'entity_name',
+                                    'context': f"Sheet Employer {source}: " + full_name})[keep])
+    return pd.concat(frames, ignore_index=True).drop_duplicates()
+
+def process_spreadsheet(path, writer=None, manifest=None):
+    source = os.path.basename(path)
+    print(f"  [Universal Spreadsheet] Parsing {source}...")
+    if manifest and manifest.is_current(path):
+        print("  [=] Unchanged since last ingest. Skipped.")
+        return 0
+    try:
+        count, seen = 0, set()
+        sheet = cols = None
+        with writer or core.SignalWriter() as w:
+            for name, df in _iter_sheet_chunks(path):
+                if cols is None or name != sheet:
+                    sheet, cols = name, _detect_columns(df)  # Once per sheet
+                    print(f"  [~] Columns: {', '.join(f'{k}={v}' for k, v in cols.items() if v)}")
+                with core.METRICS.stage('sheet_map'): signals = _sheet_signals(df, cols, source)
+                count += w.write_many(_first_sightings(signals, seen), 'people_ingest')
+            if manifest: manifest.mark(path)
+        print(f"  [+] Extracted {count} signals from Sheet.")
+        return count
+    except Exception as e:
+        print(f"  [!] Sheet Error: {e}")
+
+def _extract_pages(path, start, stop):
+    """
+    Pool task: text of pages [start, stop).
+    Returns: (texts, [(page_no, error), ...]); a bad page costs only itself.
+    """
+    import PyPDF2
+    texts, errors = [], []
+    with core.METRICS.stage('pdf_extract'), open(path, 'rb') as f:
+        reader = PyPDF2.PdfReader(f)
+        for i in range(start, stop):
+            try: texts.append(reader.pages[i].extract_text() or "")
+            except Exception as e: errors.append((i + 1, e))
+    core.METRICS.count('pages.pdf', stop - start)
+    core.METRICS.count('pages.failed', len(errors))
+    return texts, errors
+
+def _iter_pdf_pages(path, workers):
+    import PyPDF2
+    with open(path, 'rb') as f:
+        total = len(PyPDF2.PdfReader(f).pages)
+    if total < PDF_PARALLEL_PAGES: workers = 1
+    tasks = ((path, start, min(start + PDF_CHUNK, total)) for start in range(0, total, PDF_CHUNK))
+    for texts, errors in _bounded_map(_extract_pages, tasks, workers):
+        for page_no, e in errors:
+            print(f"  [!] Page {page_no} unreadable: {e}")
+        yield from texts
+
+def iter_document_lines(path, workers=None):
+    """
+    Streams a PDF page by page (or a DOCX paragraph by paragraph) as lines.
+    Peak memory is bounded by the pages in flight, not the page count.
+    """
     ext = path.lower().split('.')[-1]
+    if ext == 'pdf':
+        for text in _iter_pdf_pages(path, workers or POOL_WORKERS):
+            yield from text.split('\n')
+    elif ext == 'docx':
+        from docx import Document
+        with core.METRICS.stage('docx_extract'): paragraphs = Document(path).paragraphs
+        for para in paragraphs:
+            yield from para.text.split('\n')
+
+def process_document(path, writer=None, manifest=None, workers=None):
+    print(f"  [Gravity Mode] Scanning {os.path.basename(path)}...")
+    if manifest and manifest.is_current(path):
+        print("  [=] Unchanged since last ingest. Skipped.")
+        return 0
     
     try:
-        if ext == 'pdf':
-            with open(path, 'rb') as f:
-                reader = PyPDF2.PdfReader(f)
-                for page in reader.pages: text += page.extract_text() + "\n"
-        elif ext == 'docx':
-            doc = Document(path)
-            for para in doc.paragraphs: text += para.text + "\n"
-        
         # Run Core Gravity
         signals = 0
-        for line in text.split('\n'):
-            line = line.strip()
-            if not line: continue
-            
-            emails = core.EMAIL_REGEX.findall(line)
-            if emails:
-                for e in emails:
-                    if core.ingest_signal(e, 'email', f"Doc: {os.path.basename(path)}", 'people_ingest'):
-                        signals += 1
-            elif core.calculate_gravity(line):
-                if core.ingest_signal(line, 'entity_name', f"Doc: {os.path.basename(path)}", 'people_ingest'):
-                    signals += 1
+        context = f"Doc: {os.path.basename(path)}"
+        lines = (line.strip() for line in iter_document_lines(path, workers))
+        with writer or core.SignalWriter() as w:
+            for batch in _chunked((line for line in lines if line), SCAN_BATCH):
+                found, rest = [], []
+                with core.METRICS.stage('gravity'):
+                    for line in batch:
+                        emails = core.EMAIL_REGEX.findall(line)
+                        if emails: found.extend((e, 'email', context) for e in emails)
+                        else: rest.append(line)
+                    found.extend((line, 'entity_name', context)
+                                 for line, valid in zip(rest, core.calculate_gravity_batch(rest)) if valid)
+                signals += w.write_many(found, 'people_ingest')
+            if manifest: manifest.mark(path)
         print(f"  [+] Mined {signals} signals.")
+        return signals
     except Exception as e:
         print(f"  [!] Doc Error: {e}")
 
-def process_maildir(path):
-    print(f"  [Deep Miner] Crawling Maildir {path}...")
-    count = 0
-    for root, dirs, files in os.walk(path):
-        for f in files:
-            try:
-                with open(os.path.join(root, f), 'rb') as f_obj:
-                    msg = email.message_from_binary_file(f_obj, policy=policy.default)
-                    subject = str(msg.get('Subject', 'No Subject'))
-                    sender = str(msg.get('From', ''))
-                    
-                    # Mine Header
-                    for e in core.EMAIL_REGEX.findall(sender):
-                        core.ingest_signal(e, 'email', f"Header: {subject[:30]}", 'people_ingest')
-                        count += 1
-                    
-                    # Mine Body (Simplified Text Extract)
-                    body = ""
-                    if msg.is_multipart():
-                        for part in msg.walk():
-                            if part.get_content_type() == 'text/plain':
-                                body += part.get_payload(decode=True).decode()
-                    else:
-                        body = msg.get_payload(decode=True).decode()
-                    
-                    # Gravity Scan on Body
-                    if body:
-                        for line in body.split('\n'):
-                            if core.calculate_gravity(line):
-                                core.ingest_signal(line, 'entity_name', f"Email Body: {subject[:30]}", 'people_ingest')
-                                count += 1
-            except: continue
+def process_maildir(path, writer=None, workers=None, headers_only=False, manifest=None, progress=None):
+    mode = "Headers Only" if headers_only else "Full Body"
+    workers = workers or POOL_WORKERS
+    print(f"  [Deep Miner] Crawling Maildir {path} ({workers} workers, {mode})...")
+    if progress: progress.add_total(sum(1 for _ in _scan_tree(path)))
+    count = skipped = 0
+    with writer or core.SignalWriter() as w:
+        def fresh(paths):
+            nonlocal skipped
+            for file_path in paths:
+                if progress and progress.cancelled: return  # In-flight chunks still land
+                if manifest and manifest.is_current(file_path):
+                    skipped += 1
+                    if progress: progress.advance()
+                    continue
+                yield file_path
+        tasks = ((chunk, headers_only) for chunk in _chunked(fresh(_scan_tree(path)), MAIL_CHUNK))
+        # Pool parses; this process is the single writer
+        for results in _bounded_map(_mine_messages, tasks, workers):
+            for file_path, st, digest, signals in results:
+                mined = w.write_many(signals, 'people_ingest')
+                count += mined
+                if manifest and digest: manifest.mark(file_path, st, digest)
+                if progress: progress.advance(signals=mined)
+    if skipped: print(f"  [=] Skipped {skipped} unchanged messages.")
+    if progress and progress.cancelled:
+        print("  [~] Cancelled." + ("" if headers_only else " Re-run the same path to resume."))
     print(f"  [+] Mined {count} signals from Correspondence.")
+    return count
 
-def router(target_path):
-    if os.path.isdir(target_path):
-        # Assume Maildir if directory
-        process_maildir(target_path)
-    elif os.path.isfile(target_path):
-        fname = os.path.basename(target_path).lower()
-        if 'connections.csv' in fname:
-            process_linkedin(target_path)
-        elif fname.endswith(('.pdf', '.docx')):
-            process_document(target_path)
-        elif fname.endswith('.csv') or fname.endswith('.xlsx'):
-            print("  [Universal Spreadsheet] Logic would go here (using pandas)...")
-    else:
-        print("  [!] Invalid Path.")
+def _print_run(seconds, report_path):
+    snap = core.METRICS.snapshot()
+    signals = sum(v for k, v in snap['counters'].items() if k.startswith('signals.'))
+    stages = sorted(snap['timers'].items(), key=lambda kv: -kv[1])
+    print(f"  [⏱] {seconds:.2f}s | {signals / seconds if seconds else 0:,.0f} signals/s")
+    print("      " + " · ".join(f"{k} {v:.2f}s" for k, v in stages[:8]))
+    print(f"  [⏱] Report: {report_path}")
+
+def router(target_path, headers_only=False, force=False, rehash=False, profile=False, progress=None, workers=None):
+    core.METRICS.reset()
+    progress = progress or Progress()
+    started, clock = datetime.now(), time.perf_counter()
+    profiler = None
+    if profile:
+        import cProfile
+        profiler = cProfile.Profile()
+    if profiler: profiler.enable()
+    try:
+        with core.SignalWriter() as writer:
+            manifest = Manifest(writer, force=force, rehash=rehash)
+            if os.path.isdir(target_path):
+                # Assume Maildir if directory
+                with core.METRICS.stage('type.maildir'):
+                    process_maildir(target_path, writer, workers=workers, headers_only=headers_only,
+                                    manifest=manifest, progress=progress)
+            elif os.path.isfile(target_path):
+                fname = os.path.basename(target_path).lower()
+                progress.add_total(1)
+                mined = 0
+                with core.METRICS.stage(f"type.{fname.split('.')[-1]}"):
+                    if 'connections.csv' in fname:
+                        mined = process_linkedin(target_path, writer, manifest)
+                    elif fname.endswith(('.pdf', '.docx')):
+                        mined = process_document(target_path, writer, manifest, workers)
+                    elif fname.endswith('.csv') or fname.endswith('.xlsx'):
+                        mined = process_spreadsheet(target_path, writer, manifest)
+                progress.advance(signals=mined)
+            else:
+                print("  [!] Invalid Path.")
+    except Exception as e:
+        print(f"  [!] Write Error: {e}")
+    finally:
+        profile_path = None
+        if profiler:
+            # Main process only: pool workers show up as time spent waiting on them
+            import pstats
+            profiler.disable()
+            os.makedirs(core.REPORT_DIR, exist_ok=True)
+            profile_path = os.path.join(core.REPORT_DIR, f"ingest_{started:%Y%m%d_%H%M%S_%f}.prof")
+            profiler.dump_stats(profile_path)
+            pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+        seconds = time.perf_counter() - clock
+        _print_run(seconds, core.record_run(target_path, started, seconds, profile_path))
@@ -1,52 +1,96 @@
 import os
 import time
-import people_init
-import people_ingest
-import people_governance
 import people_core
-import people_node  # <--- NEW IMPORT
+import people_jobs # Light: loads the Harvester only when a job starts
+
+# Subsystems load when their menu option is chosen, so opening the Commander
+# never pays for pandas & the parsers. Budget: `python3 people_bench.py startup`.
 
 def clear(): os.system('cls' if os.name == 'nt' else 'clear')
 
 def main():
+    profile = False
     while True:
         clear()
         print("--- SOVEREIGN TALENT ENGINE (2030) ---")
         print("Host: iMac 12.1 | Substrate: people.db\n")
+        status = people_jobs.status_line()
+        if status: print(f" [⚙] {status}\n")
         
         print(" [1] INITIALIZE  (Wipe & Rebuild World)")
         print(" [2] INGEST      (Docs, Emails, LinkedIn)")
         print(" [3] GOVERN      (Import/Export COA)")
         print(" [4] HEAL        (Force Identity Merge)")
         print(" [5] HUNTER      (Verify Targets)")  # <--- NEW OPTION
+        print(" [6] COMPACT     (Fold Repeated Provenance)")
+        print(" [J] JOBS        (Background Ingest: Progress, Cancel, Resume)")
+        print(f" [P] PROFILE     (cProfile Ingest: {'ON' if profile else 'OFF'})")
         print(" [Q] QUIT")
         
         choice = input("\nCommand > ").upper().strip()
         
         if choice == '1':
+            if people_jobs.active_job():
+                print("  [!] An ingest is running. Cancel it under [J] JOBS first.")
+                input("\nPress Enter...")
+                continue
             confirm = input("Are you sure? This deletes people.db (Y/N): ")
             if confirm.upper() == 'Y':
+                import people_init
+                people_core.release()  # Close & checkpoint before the file is wiped
                 people_init.initialize_world()
                 input("\nPress Enter...")
         
         elif choice == '2':
+            if people_jobs.active_job():
+                print("  [!] An ingest is already running. See [J] JOBS.")
+                input("\nPress Enter...")
+                continue
             path = input("Enter Path (File or Folder): ").strip()
-            people_ingest.router(path)
-            people_core.self_heal_network()
+            mode = input("[ENTER]=Changed Only | [F]=Force | [R]=Rehash > ").upper().strip()
+            body = input("[ENTER]=Full Body | [H]=Headers Only (Maildir) > ").upper().strip()
+            workers = input(f"Parser Workers [ENTER]={os.cpu_count() or 1} > ").strip()
+            workers = int(workers) if workers.isdigit() and int(workers) > 0 else None
+            # Ingest + heal run in the background; the menu & Hunter stay live
+            job = people_jobs.start_ingest(path, force=(mode == 'F'), rehash=(mode == 'R'), profile=profile,
+                                           headers_only=(body == 'H'), workers=workers)
+            print(f"  [+] Job #{job.id} started. Track it under [J] JOBS.")
             input("\nPress Enter...")
             
         elif choice == '3':
+            import people_governance
             people_governance.main_menu()
             
         elif choice == '4':
-            people_core.self_heal_network()
+            if people_jobs.active_job():
+                print("  [!] An ingest is running; it heals when it finishes. See [J] JOBS.")
+                input("\nPress Enter...")
+                continue
+            mode = input("[ENTER]=New Signals Only | [F]=Full Re-Match > ").upper().strip()
+            people_core.self_heal_network(full=(mode == 'F'))
             input("\nPress Enter...")
 
         elif choice == '5':         # <--- NEW LOGIC
+            import people_node
             people_node.start_hunt()
             input("\nPress Enter...")
             
+        elif choice == '6':
+            people_core.compact_logs()  # Online: safe while a job ingests
+            input("\nPress Enter...")
+
+        elif choice == 'J':
+            people_jobs.jobs_menu()
+
+        elif choice == 'P':
+            profile = not profile
+
         elif choice == 'Q':
+            job = people_jobs.active_job()
+            if job:
+                if input("An ingest is running. Cancel it and quit? (Y/N): ").upper() != 'Y': continue
+                job.cancel()
+                job.join()  # Let the current file commit so a re-run resumes cleanly
             print("System Offline.")
             break
 
@@ -0,0 +1,171 @@
+import sys
+import time
+import threading
+from collections import deque
+import people_core as core # The Brain
+
+# Ingest & heal run on a background thread so the Commander (and the Hunter)
+# stay responsive. SQLite WAL lets the Hunter read & verify while the job writes;
+# the heavy parsing already happens in the Harvester's process pool.
+
+# --- DISPATCH SETTINGS ---
+LOG_LINES = 200  # Output lines kept per job for the [J] JOBS screen
+
+JOBS = []  # Every job this session, oldest first
+
+class _ThreadStdout:
+    """
+    Routes print() by thread: a job thread writes into its own log, every
+    other thread (the menu, the Hunter) keeps the real terminal.
+    """
+    def __init__(self, real):
+        self.real = real
+        self.routes = {}
+
+    def write(self, text):
+        return self.routes.get(threading.get_ident(), self.real).write(text)
+
+    def flush(self): self.real.flush()
+
+    def __getattr__(self, name): return getattr(self.real, name)
+
+def _route_stdout():
+    if not isinstance(sys.stdout, _ThreadStdout): sys.stdout = _ThreadStdout(sys.stdout)
+    return sys.stdout
+
+class JobLog:
+    """Line buffer the job thread prints into. Keeps the last LOG_LINES lines."""
+    def __init__(self):
+        self.lines = deque(maxlen=LOG_LINES)
+        self._partial = ''
+
+    def write(self, text):
+        text = self._partial + text
+        *done, self._partial = text.split('\n')
+        self.lines.extend(line for line in done if line.strip())
+        return len(text)
+
+    def flush(self): pass
+
+class IngestJob(threading.Thread):
+    """
+    One background ingest: router() over a path, then self_heal_network().
+    States: running -> healing -> done | cancelled | failed.
+    """
+    def __init__(self, path, headers_only=False, force=False, rehash=False, profile=False, workers=None):
+        super().__init__(daemon=True, name=f"ingest-{len(JOBS) + 1}")
+        import people_ingest
+        self.id = len(JOBS) + 1
+        self.path = path
+        self.options = dict(headers_only=headers_only, force=force, rehash=rehash, profile=profile,
+                            workers=workers)
+        self.progress = people_ingest.Progress()
+        self.log = JobLog()
+        self.state = 'queued'
+        self.error = None
+        self.finished = None
+
+    def run(self):
+        import people_ingest
+        stdout = _route_stdout()
+        stdout.routes[threading.get_ident()] = self.log
+        try:
+            self.state = 'running'
+            people_ingest.router(self.path, progress=self.progress, **self.options)
+            self.state = 'healing'  # A partial (cancelled) ingest is still worth healing
+            core.self_heal_network()
+            self.state = 'cancelled' if self.progress.cancelled else 'done'
+        except Exception as e:
+            self.state, self.error = 'failed', e
+            print(f"  [!] Job Error: {e}")
+        finally:
+            self.finished = time.time()
+            core.release()  # This thread's connection dies with it
+            stdout.routes.pop(threading.get_ident(), None)
+
+    @property
+    def active(self): return self.state in ('queued', 'running', 'healing')
+
+    def cancel(self): self.progress.cancel()
+
+    def status(self):
+        """One-line progress: files done/total, signals/s, ETA."""
+        snap = self.progress.snapshot()
+        line = f"#{self.id} {self.state.upper():<9} {self.path}"
+        line += f" | files {snap['files_done']}/{snap['files_total']}"
+        line += f" | {snap['signals']} signals @ {snap['signals_per_sec']:,.0f}/s"
+        if self.state == 'running':
+            if self.progress.cancelled: line += " | cancelling..."
+            elif snap['eta'] is not None: line += f" | ETA {_clock(snap['eta'])}"
+        elif self.finished:
+            line += f" | took {_clock(self.finished - self.progress.started)}"
+        return line
+
+def _clock(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+def active_job():
+    """The running job, if any. One at a time: the Harvester is a single writer."""
+    return next((job for job in JOBS if job.active), None)
+
+def start_ingest(path, **options):
+    """Starts a background ingest. Returns: the job, or None if one is already running."""
+    if active_job(): return None
+    job = IngestJob(path, **options)
+    JOBS.append(job)
+    job.start()
+    return job
+
+def resumable(job):
+    """
+    Headers-only runs never reach the Ledger (they skip the content hash), so
+    a resume would re-mine and double-count every message already done.
+    """
+    return job.state in ('cancelled', 'failed') and not job.options['headers_only']
+
+def resume(job):
+    """
+    Re-runs a cancelled or failed job over the same path. The Ledger skips every
+    file the first run committed, so work picks up at the next file.
+    Returns: the new job, or None if `job` is not resumable() or one is running.
+    """
+    if not resumable(job): return None
+    options = dict(job.options, force=False, rehash=False)  # Force would redo finished files
+    return start_ingest(job.path, **options)
+
+def status_line():
+    job = active_job()
+    return job.status() if job else None
+
+def jobs_menu():
+    """The [J] JOBS screen: live progress, tail of the job log, cancel & resume."""
+    while True:
+        print("\n--- JOBS ---")
+        if not JOBS: print("  No jobs this session.")
+        for job in JOBS:
+            note = " | headers only: no resume" if job.options['headers_only'] and not job.active else ''
+            print(f"  {job.status()}{note}")
+        latest = JOBS[-1] if JOBS else None
+        if latest:
+            print(f"\n  Log #{latest.id}:")
+            for line in list(latest.log.lines)[-10:]: print(f"  {line}")
+
+        choice = input("\n[ENTER]=Refresh | [C]=Cancel | [R]=Resume | [B]=Back > ").upper().strip()
+        if choice == 'C':
+            job = active_job()
+            if job:
+                job.cancel()
+                print(f"  [~] Job #{job.id} stops after the current file.")
+            else: print("  [!] Nothing running.")
+        elif choice == 'R':
+            job = next((j for j in reversed(JOBS) if j.state in ('cancelled', 'failed')), None)
+            if not job: print("  [!] Nothing to resume.")
+            elif not resumable(job):
+                print(f"  [!] Job #{job.id} was headers-only: those runs skip the Ledger, so a resume "
+                      "would count finished messages twice.")
+            elif active_job(): print("  [!] A job is already running.")
+            else: print(f"  [+] Resumed as Job #{resume(job).id}.")
+        elif choice == 'B':
+            break
@@ -0,0 +1,209 @@
+import re
+import zlib
+import random
+from array import array
+from itertools import chain, combinations
+import people_core as core # The Brain
+
+# uuid5 anchors the exact string, so "ACME Capital, LLC" and "Acme Capital LLC"
+# are born as two Entities. The Matchmaker finds them without comparing every
+# pair: names are reduced to blocking keys, signed with MinHash and bucketed
+# with LSH. Keys & buckets live in people.db (entity_keys, entity_lsh), so each
+# heal only signs the Entities discovered since the last one.
+
+# --- RESOLUTION SETTINGS ---
+BANDS = 8               # LSH bands
+ROWS = 4                # MinHash values per band (BANDS * ROWS permutations)
+SHINGLE = 3             # Character n-gram size
+MATCH_THRESHOLD = 0.85  # n-gram Jaccard a candidate pair must reach to merge
+MAX_BUCKET = 50         # Skip LSH buckets with more Entities than this
+MINHASH_SEED = 2030     # Signatures are persisted: never change the permutations
+INDEX_BATCH = 5000      # Entities signed per batch
+
+# Legal forms only. Descriptive suffixes (Capital, Bank, University...) tell
+# real organizations apart: "Acme Bank" is not "Acme Capital".
+LEGAL_FORMS = {'llc', 'inc', 'ltd', 'corp', 'lp', 'ag'}
+PUNCT_REGEX = re.compile(r"[^\w\s]|_")
+
+_PRIME = (1 << 31) - 1
+_rng = random.Random(MINHASH_SEED)
+PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(_PRIME)) for _ in range(BANDS * ROWS)]
+
+def _load_numpy():
+    try:
+        import numpy as np
+        return np
+    except ImportError:
+        return None
+
+def blocking_key(name, entity_type):
+    """
+    Case, punctuation & word order folded away; legal forms dropped from
+    Organizations. "ACME Capital, LLC" -> "acme capital", "Doe,  Jane" -> "doe jane".
+    """
+    tokens = PUNCT_REGEX.sub(' ', name.lower()).split()
+    if entity_type == 'Organization':
+        tokens = [t for t in tokens if t not in LEGAL_FORMS] or tokens
+    return ' '.join(sorted(tokens))
+
+def numbers(key):
+    """Digit-bearing tokens. "jane doe 11" and "jane doe 111" are different people."""
+    return [token for token in key.split() if any(ch.isdigit() for ch in token)]
+
+def shingles(key):
+    padded = f" {key} "
+    return {padded[i:i + SHINGLE] for i in range(len(padded) - SHINGLE + 1)}
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+def signatures(keys):
+    """
+    MinHash signatures (BANDS * ROWS ints) for non-empty blocking keys.
+    Vectorized with numpy when available; same values either way.
+    """
+    hashed = [[zlib.crc32(g.encode()) % _PRIME for g in shingles(key)] for key in keys]
+    np = _load_numpy()
+    if np is None or not hashed:
+        return [[min((a * h + b) % _PRIME for h in hashes) for a, b in PERMUTATIONS] for hashes in hashed]
+    flat = np.fromiter(chain.from_iterable(hashed), dtype=np.uint64)
+    starts = np.cumsum([0] + [len(hashes) for hashes in hashed[:-1]])
+    a = np.array([p[0] for p in PERMUTATIONS], dtype=np.uint64)[:, None]
+    b = np.array([p[1] for p in PERMUTATIONS], dtype=np.uint64)[:, None]
+    return np.minimum.reduceat((a * flat + b) % _PRIME, starts, axis=1).T.tolist()
+
+def buckets(signature):
+    """Returns: [(band, bucket), ...]; one bucket per band of ROWS values."""
+    return [(band, zlib.crc32(array('Q', signature[band * ROWS:(band + 1) * ROWS]).tobytes()))
+            for band in range(BANDS)]
+
+def _index(cursor, watermark, high):
+    """
+    Keys & signs the named Entities logged in (watermark, high] that are not
+    indexed yet. They are left in the temp table resolve_new.
+    """
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS resolve_new (sovereign_id TEXT PRIMARY KEY)")
+    cursor.execute("DELETE FROM resolve_new")
+    # Unary + keeps the scan on the id range instead of the signal_type index
+    cursor.execute('''
+        INSERT OR IGNORE INTO resolve_new
+        SELECT l.sovereign_id FROM metadata_logs l
+        JOIN entities e ON e.sovereign_id = l.sovereign_id
+        WHERE l.id > ? AND l.id <= ? AND +l.signal_type = 'entity_name'
+          AND l.sovereign_id NOT IN (SELECT sovereign_id FROM entity_keys)
+    ''', (watermark, high))
+    rows = cursor.connection.execute('''
+        SELECT e.sovereign_id, e.display_name, e.entity_type FROM entities e
+        JOIN resolve_new n ON n.sovereign_id = e.sovereign_id
+    ''')
+    while True:
+        batch = rows.fetchmany(INDEX_BATCH)
+        if not batch: break
+        keyed = [(sov_id, entity_type, blocking_key(name or '', entity_type)) for sov_id, name, entity_type in batch]
+        keyed = [row for row in keyed if row[2]]
+        with core.METRICS.stage('minhash'): sigs = signatures([key for _, _, key in keyed])
+        cursor.executemany("INSERT OR REPLACE INTO entity_keys (sovereign_id, entity_type, norm_key) VALUES (?, ?, ?)",
+                           keyed)
+        cursor.executemany("INSERT INTO entity_lsh (band, bucket, sovereign_id) VALUES (?, ?, ?)",
+                           ((band, bucket, sov_id) for (sov_id, _, _), sig in zip(keyed, sigs)
+                            for band, bucket in buckets(sig)))
+    cursor.execute("DELETE FROM resolve_new WHERE sovereign_id NOT IN (SELECT sovereign_id FROM entity_keys)")
+
+def _candidates(cursor):
+    """
+    Pairs touching a new Entity: whole exact-key blocks, plus LSH bucket-mates
+    with the same numbers() whose n-gram Jaccard reaches MATCH_THRESHOLD.
+    Always the same entity_type.
+    CROSS JOIN pins the lookups to the new Entities instead of scanning the index.
+    """
+    pairs = set()
+    cursor.execute('''
+        SELECT k.entity_type, k.norm_key, k.sovereign_id FROM entity_keys k
+        WHERE (k.entity_type, k.norm_key) IN
+              (SELECT k2.entity_type, k2.norm_key FROM resolve_new n
+               CROSS JOIN entity_keys k2 ON k2.sovereign_id = n.sovereign_id)
+        ORDER BY k.entity_type, k.norm_key
+    ''')
+    blocks = {}
+    for entity_type, key, sov_id in cursor.fetchall():
+        blocks.setdefault((entity_type, key), []).append(sov_id)
+    for members in blocks.values():
+        pairs.update(zip(members, members[1:]))  # A chain is enough to join the block
+
+    cursor.execute('''
+        SELECT group_concat(k.sovereign_id || ' ' || k.entity_type || ' ' || k.norm_key, char(31))
+        FROM entity_lsh l JOIN entity_keys k ON k.sovereign_id = l.sovereign_id
+        WHERE (l.band, l.bucket) IN
+              (SELECT l2.band, l2.bucket FROM resolve_new n
+               CROSS JOIN entity_lsh l2 ON l2.sovereign_id = n.sovereign_id)
+        GROUP BY l.band, l.bucket HAVING COUNT(*) BETWEEN 2 AND ?
+    ''', (MAX_BUCKET,))  # Larger buckets are common tokens, not identities
+    groups, keys = [], {}
+    for (packed,) in cursor.fetchall():
+        members = []
+        for member in packed.split('\x1f'):
+            sov_id, entity_type, key = member.split(' ', 2)
+            keys[sov_id] = (entity_type, key)
+            members.append(sov_id)
+        groups.append(sorted(members))
+    cursor.execute("SELECT sovereign_id FROM resolve_new")
+    fresh = {row[0] for row in cursor.fetchall()}
+    grams, seen = {}, set()
+    def grams_of(sov_id):
+        if sov_id not in grams: grams[sov_id] = shingles(keys[sov_id][1])
+        return grams[sov_id]
+    for members in groups:
+        for a, b in combinations(members, 2):  # Bands repeat pairs; verify each once
+            if (a not in fresh and b not in fresh) or (a, b) in seen: continue
+            seen.add((a, b))
+            if keys[a][0] != keys[b][0] or keys[a][1] == keys[b][1]: continue
+            if numbers(keys[a][1]) != numbers(keys[b][1]): continue  # Jaccard barely sees a digit
+            ga, gb = grams_of(a), grams_of(b)
+            if min(len(ga), len(gb)) < MATCH_THRESHOLD * max(len(ga), len(gb)): continue  # Jaccard bound
+            if jaccard(ga, gb) >= MATCH_THRESHOLD: pairs.add((a, b))
+    return pairs
+
+def _cluster(cursor, pairs):
+    """
+    Union-find over matched pairs. The primary is a surveyed (non-Discovery)
+    Entity if there is one, else the earliest-seen. Two surveyed Entities
+    are never merged: a human already decided they are different.
+    Returns: {dup_id: primary_id}
+    """
+    rank = {}
+    for sov_id in {x for pair in pairs for x in pair}:
+        cursor.execute("SELECT status FROM entities WHERE sovereign_id = ?", (sov_id,))
+        status = cursor.fetchone()
+        cursor.execute("SELECT MIN(id) FROM metadata_logs WHERE sovereign_id = ?", (sov_id,))
+        rank[sov_id] = (status is None or status[0] == 'Discovery', cursor.fetchone()[0] or 0, sov_id)
+    parent = {x: x for x in rank}
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    for a, b in sorted(pairs):
+        a, b = find(a), find(b)
+        if a == b or (not rank[a][0] and not rank[b][0]): continue
+        if rank[b] < rank[a]: a, b = b, a
+        parent[b] = a
+    return {x: find(x) for x in parent if find(x) != x}
+
+def resolve(cursor, full=False):
+    """
+    The Matchmaker. Indexes newly discovered named Entities and merges their
+    near-duplicates through core.merge_identities. `full` rebuilds the index.
+    Returns: number of identities merged
+    """
+    if full:
+        cursor.execute("DELETE FROM entity_keys")
+        cursor.execute("DELETE FROM entity_lsh")
+    watermark = 0 if full else int(core.get_state(cursor, 'resolve_watermark', 0))
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM metadata_logs")
+    high = cursor.fetchone()[0]
+
+    _index(cursor, watermark, high)
+    with core.METRICS.stage('resolve_match'): mapping = _cluster(cursor, _candidates(cursor))
+    count = core.merge_identities(cursor, mapping, 'Name Match')
+    core.set_state(cursor, 'resolve_watermark', high)
+    return count
@@ -1,17 +1,52 @@
-import sqlite3
 import os
+from concurrent.futures import ThreadPoolExecutor
 import people_core as core
 
+PAGE_SIZE = 50  # Targets per queue page
+
 def clear(): os.system('cls' if os.name == 'nt' else 'clear')
 
 def get_context(cursor, sov_id):
     """Fetches the most recent 'Evidence'."""
     try:
-        cursor.execute("SELECT details FROM metadata_logs WHERE details LIKE ? ORDER BY id DESC LIMIT 1", (f"{sov_id}%",))
+        cursor.execute("SELECT last_context FROM entity_stats WHERE sovereign_id = ?", (sov_id,))
         result = cursor.fetchone()
-        return result[0].split(' :: ')[-1] if result else "No Context"
+        return result[0] if result and result[0] else "No Context"
     except: return "No Context"
 
+def get_page(after=None):
+    """
+    One page of the Discovery queue in priority order (most sources, then most
+    signals), served straight off idx_stats_priority. `after` is the previous
+    page's last (source_count, signal_count, sov_id) keyset.
+    Returns: [(sov_id, name, context, source_count, signal_count), ...]
+    """
+    cursor = core.connect().cursor()  # This thread's own connection
+    # CROSS JOIN keeps the walk on the priority index; entities is probed per row
+    keyset = "AND (s.source_count, s.signal_count, s.sovereign_id) < (?, ?, ?)" if after else ""
+    cursor.execute(f'''
+        SELECT s.sovereign_id, e.display_name, COALESCE(s.last_context, 'No Context'),
+               s.source_count, s.signal_count
+        FROM entity_stats s CROSS JOIN entities e ON e.sovereign_id = s.sovereign_id
+        WHERE e.status = 'Discovery' {keyset}
+        ORDER BY s.source_count DESC, s.signal_count DESC, s.sovereign_id DESC LIMIT ?
+    ''', (*(after or ()), PAGE_SIZE))
+    return cursor.fetchall()
+
+def iter_queue():
+    """Streams the Discovery queue, prefetching the next page in the background."""
+    seen = set()  # Counts move while we hunt; never show a target twice
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        page = get_page()
+        while page:
+            sov_id, _, _, sources, signals = page[-1]
+            upcoming = pool.submit(get_page, (sources, signals, sov_id))
+            for target in page:
+                if target[0] not in seen:
+                    seen.add(target[0])
+                    yield target
+            page = upcoming.result()
+
 def menu_select(options, prompt):
     """Generic CLI Menu Selector."""
     print(f"\n  --- {prompt} ---")
@@ -27,16 +62,14 @@ def menu_select(options, prompt):
         except: pass
 
 def start_hunt():
-    conn = sqlite3.connect(core.DB_NAME)
-    cursor = conn.cursor()
+    cursor = core.connect().cursor()
     
-    # 1. Fetch Discovery Queue
-    cursor.execute("SELECT sovereign_id, display_name FROM entities WHERE status = 'Discovery'")
-    targets = cursor.fetchall()
+    # 1. Count the Discovery Queue (the targets themselves stream in pages)
+    cursor.execute("SELECT COUNT(*) FROM entities WHERE status = 'Discovery'")
+    pending = cursor.fetchone()[0]
     
-    if not targets:
+    if not pending:
         print("\n  [All Clear] No targets pending verification.")
-        conn.close()
         return
 
     # Pre-fetch Menus (Cache)
@@ -44,15 +77,15 @@ def start_hunt():
     archetypes = [a[1] for a in archetypes_raw]
     domains = core.get_domains()
     
-    print(f"\n--- HUNTER PROTOCOL ACTIVATED ({len(targets)} Targets) ---")
+    print(f"\n--- HUNTER PROTOCOL ACTIVATED ({pending} Targets) ---")
     
-    for sov_id, name in targets:
+    for sov_id, name, context, sources, signals in iter_queue():
         clear()
-        context = get_context(cursor, sov_id)
         
         print("-" * 60)
         print(f"TARGET: {name}")
         print(f"PROOF:  {context}")
+        print(f"WEIGHT: {signals} signals from {sources} sources")
         print("-" * 60)
         
         # --- Q1: IDENTITY (The Gate) ---
@@ -60,7 +93,8 @@ def start_hunt():
         action = input("  [ENTER]=Verify | [X]=Burn | [S]=Skip > ").lower().strip()
         
         if action == 'x':
-            cursor.execute("UPDATE entities SET status = 'Burned' WHERE sovereign_id = ?", (sov_id,))
+            core.write_transaction(lambda cur: cur.execute(
+                "UPDATE entities SET status = 'Burned' WHERE sovereign_id = ?", (sov_id,)))
             print("  [x] Burned.")
             continue
         elif action == 's':
@@ -83,20 +117,20 @@ def start_hunt():
         edge = input("  Who is this person connected to? (Name/Company) > ").strip()
         
         # --- COMMIT THE TWIN ---
-        # 1. Update Status
-        cursor.execute("UPDATE entities SET status = 'Verified' WHERE sovereign_id = ?", (sov_id,))
-        
-        # 2. Log the Digital Twin Profile
-        profile_str = f"Domain:{domain} | Pulse:{primary} | Shadow:{secondary} | Connected:{edge}"
-        core.log_action('NODE_MATURE', f"{sov_id} :: {profile_str}")
-        
-        # 3. Create the Edge (if provided)
-        if edge:
-            core.ingest_signal(edge, 'entity_name', f"Edge from {name}", 'people_node')
+        # One write transaction; log_action & ingest_signal join it
+        def mature(cur):
+            # 1. Update Status
+            cur.execute("UPDATE entities SET status = 'Verified' WHERE sovereign_id = ?", (sov_id,))
+            
+            # 2. Log the Digital Twin Profile
+            profile_str = f"Domain:{domain} | Pulse:{primary} | Shadow:{secondary} | Connected:{edge}"
+            core.log_action('NODE_MATURE', f"{sov_id} :: {profile_str}")
             
-        conn.commit()
+            # 3. Create the Edge (if provided)
+            if edge:
+                core.ingest_signal(edge, 'entity_name', f"Edge from {name}", 'people_node')
+        core.write_transaction(mature)
         print(f"\n  [+] Target {name} Fully Maturated.")
         input("  Press Enter for next target...")
 
-    conn.close()
     print("\n--- HUNT COMPLETE ---")